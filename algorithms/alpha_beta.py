@@ -12,9 +12,81 @@ Key concepts:
 - Pruning: Skip evaluating moves when they're proven to be worse than a previously examined move
 """
 
-import copy
 import random
 import time
+from functools import lru_cache
+
+# Transposition table entry types
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Start over once the table holds this many positions
+MAX_TABLE_SIZE = 200000
+
+# Half-width of the window searched around the previous depth's score
+ASPIRATION_WINDOW = 10
+
+
+@lru_cache(maxsize=None)
+def _row_masks(size):
+    """Bitboard masks of the top and bottom rows of a board"""
+    row = (1 << size) - 1
+    return row, row << (size * (size - 1))
+
+
+@lru_cache(maxsize=None)
+def _move_table(size, piece_type):
+    """Per-square (target bit, target square, is diagonal) moves for a piece type"""
+    if piece_type == 1:  # Player piece (moves up)
+        directions = [(-1, 0), (-1, -1), (-1, 1)]
+    elif piece_type == 2:  # AI piece (moves down)
+        directions = [(1, 0), (1, -1), (1, 1)]
+    elif piece_type > 10:  # Special piece
+        directions = [
+            (-1, 0),
+            (1, 0),
+            (0, -1),
+            (0, 1),
+            (-1, -1),
+            (-1, 1),
+            (1, -1),
+            (1, 1),
+        ]
+    else:
+        directions = []
+
+    table = []
+    for row in range(size):
+        for col in range(size):
+            moves = []
+            for d_row, d_col in directions:
+                new_row, new_col = row + d_row, col + d_col
+
+                # Check if position is on the board
+                if 0 <= new_row < size and 0 <= new_col < size:
+                    moves.append(
+                        (
+                            1 << (new_row * size + new_col),
+                            (new_row, new_col),
+                            abs(d_row) == 1 and abs(d_col) == 1,
+                        )
+                    )
+            table.append(moves)
+    return table
+
+
+@lru_cache(maxsize=None)
+def _square_weights(size):
+    """Per-square evaluation terms for an AI piece and for a player piece"""
+    ai_weights = []
+    player_weights = []
+    for row in range(size):
+        for col in range(size):
+            center_bonus = abs(col - size // 2)
+
+            # Progress toward the goal row, center control and the piece itself
+            ai_weights.append(row * 2 - center_bonus + 10)
+            player_weights.append(-(size - row - 1) * 2 + center_bonus - 10)
+    return ai_weights, player_weights
 
 
 class AlphaBetaAI:
@@ -33,6 +105,9 @@ class AlphaBetaAI:
             "branching_factor": 0,
         }
 
+        # Scores of searched positions, kept across moves and games
+        self.transposition_table = {}
+
     def get_best_move(self, board, ai_piece, player_piece):
         """
         Find the best move using alpha-beta pruning
@@ -49,6 +124,11 @@ class AlphaBetaAI:
         self.nodes_evaluated = 0
         self.nodes_pruned = 0
         self.start_time = time.time()
+        if len(self.transposition_table) > MAX_TABLE_SIZE:
+            self.transposition_table.clear()
+
+        # Search on bitboards rather than copies of the nested list
+        state = self._load_board(board, ai_piece, player_piece)
 
         # Get AI's pieces positions and possible moves
         ai_pieces = []
@@ -60,12 +140,6 @@ class AlphaBetaAI:
         if not ai_pieces:
             return None
 
-        # Try moving each piece to find the best move
-        best_score = float("-inf")
-        best_move = None
-        alpha = float("-inf")
-        beta = float("inf")
-
         # Track branching factor
         total_branches = 0
         move_count = 0
@@ -73,46 +147,30 @@ class AlphaBetaAI:
         # Randomize order to avoid predictable behavior
         random.shuffle(ai_pieces)
 
+        root_moves = []
         for from_pos in ai_pieces:
-            from_row, from_col = from_pos
-            moves = self.get_valid_moves(
-                board, from_row, from_col, ai_piece, player_piece
-            )
+            moves = self.get_valid_moves(state, from_pos, True)
 
             # Update branching factor calculation
             total_branches += len(moves)
             if len(moves) > 0:
                 move_count += 1
 
-            for to_pos in moves:
-                # Make a deep copy of the board to simulate the move
-                new_board = copy.deepcopy(board)
-                self.make_move(new_board, from_pos, to_pos)
-
-                # Calculate score for this move using alpha-beta
-                score = self.alpha_beta(
-                    new_board,
-                    self.max_depth,
-                    False,
-                    alpha,
-                    beta,
-                    ai_piece,
-                    player_piece,
-                )
-
-                if score > best_score:
-                    best_score = score
-                    best_move = (from_pos, to_pos)
-
-                # Update alpha
-                alpha = max(alpha, best_score)
-
-                # Check time limit
-                if time.time() - self.start_time > self.max_time:
-                    break
+            for to_pos, new_state in moves:
+                root_moves.append(((from_pos, to_pos), new_state))
 
-            if time.time() - self.start_time > self.max_time:
+        # Deepen one ply at a time, trying the last best move first so the
+        # deeper searches prune more. Out of time, keep the last full result
+        best_move = None
+        score = None
+        for depth in range(self.max_depth + 1):
+            move, score = self._search_window(root_moves, depth, score)
+            timed_out = time.time() - self.start_time > self.max_time
+            if best_move is None or not timed_out:
+                best_move = move
+            if timed_out:
                 break
+            root_moves.sort(key=lambda root_move: root_move[0] != best_move)
 
         # Calculate average branching factor
         avg_branching_factor = total_branches / max(1, move_count)
@@ -123,20 +181,57 @@ class AlphaBetaAI:
 
         return best_move
 
-    def alpha_beta(
-        self, board, depth, is_maximizing, alpha, beta, ai_piece, player_piece
-    ):
+    def _search_window(self, root_moves, depth, guess):
+        """Search the root moves in a narrow window around a guessed score"""
+        # Wins and lost positions leave nothing to aim around
+        if guess is None or abs(guess) >= 1000:
+            return self._search_root(root_moves, depth)
+
+        alpha = guess - ASPIRATION_WINDOW
+        beta = guess + ASPIRATION_WINDOW
+        move, score = self._search_root(root_moves, depth, alpha, beta)
+
+        # Outside the window the score is only a bound, so search once more
+        # with the full window
+        if score <= alpha or score >= beta:
+            move, score = self._search_root(root_moves, depth)
+
+        return move, score
+
+    def _search_root(self, root_moves, depth, alpha=float("-inf"), beta=float("inf")):
+        """Find the best of the AI's (move, state) options searched to a depth"""
+        best_score = float("-inf")
+        best_move = None
+
+        for move, new_state in root_moves:
+            # Calculate score for this move using alpha-beta
+            score = self.alpha_beta(new_state, depth, False, alpha, beta)
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+
+            # Update alpha, and stop once the move beats the window
+            alpha = max(alpha, best_score)
+            if best_score >= beta:
+                break
+
+            # Check time limit
+            if time.time() - self.start_time > self.max_time:
+                break
+
+        return best_move, best_score
+
+    def alpha_beta(self, state, depth, is_maximizing, alpha, beta):
         """
         Alpha-beta pruning algorithm
 
         Args:
-            board: Current board state
+            state: Current board state as (ai, player, blocked) bitboards
             depth: Current depth in search tree
             is_maximizing: Whether current player is maximizing (AI) or minimizing (player)
             alpha: Alpha value for pruning
             beta: Beta value for pruning
-            ai_piece: AI's piece identifier
-            player_piece: Player's piece identifier
 
         Returns:
             Score for the current board state
@@ -151,65 +246,73 @@ class AlphaBetaAI:
             self.pruning_stats["max_depth_reached"], current_depth
         )
 
+        # Reuse the score of a position already searched to this depth
+        key = (state, depth, is_maximizing, self._setup)
+        entry = self.transposition_table.get(key)
+        if entry is not None:
+            score, bound = entry
+            if (
+                bound == EXACT
+                or (bound == LOWER_BOUND and score >= beta)
+                or (bound == UPPER_BOUND and score <= alpha)
+            ):
+                return score
+
+        score = self._search(state, depth, is_maximizing, alpha, beta)
+
+        # Scores cut short by the time limit aren't worth keeping
+        if time.time() - self.start_time > self.max_time:
+            return score
+
+        if score <= alpha:
+            bound = UPPER_BOUND
+        elif score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.transposition_table[key] = (score, bound)
+
+        return score
+
+    def _search(self, state, depth, is_maximizing, alpha, beta):
+        """Search a position that isn't in the transposition table"""
+        current_depth = self.max_depth - depth
+
         # Check terminal conditions
         if (
             depth == 0
-            or self.is_terminal_state(board)
+            or self.is_terminal_state(state)
             or time.time() - self.start_time > self.max_time
         ):
-            return self.evaluate_board(board, ai_piece, player_piece)
+            return self.evaluate_board(state)
 
         if is_maximizing:
             # AI's turn - maximize score
             value = float("-inf")
 
-            # Get all possible moves for AI pieces
-            for row in range(len(board)):
-                for col in range(len(board[0])):
-                    if board[row][col] == ai_piece:
-                        moves = self.get_valid_moves(
-                            board, row, col, ai_piece, player_piece
-                        )
-                        for to_pos in moves:
-                            # Make a deep copy of the board to simulate the move
-                            new_board = copy.deepcopy(board)
-                            self.make_move(new_board, (row, col), to_pos)
-
-                            # Recursive alpha-beta call
-                            eval = self.alpha_beta(
-                                new_board,
-                                depth - 1,
-                                False,
-                                alpha,
-                                beta,
-                                ai_piece,
-                                player_piece,
-                            )
-                            value = max(value, eval)
-                            alpha = max(alpha, value)
-
-                            # Alpha-beta pruning
-                            if beta <= alpha:
-                                self.nodes_pruned += 1
-                                self.pruning_stats["pruned_nodes"] += 1
-
-                                # Record pruning event for visualization
-                                self.pruning_stats["pruning_events"].append(
-                                    {
-                                        "depth": current_depth,
-                                        "alpha": alpha,
-                                        "beta": beta,
-                                        "is_maximizing": True,
-                                        "value": value,
-                                    }
-                                )
-
-                                break
-
-                        if beta <= alpha:
-                            break
+            # Try every move of every AI piece
+            for new_state in self._child_states(state, True):
+                # Recursive alpha-beta call
+                eval = self.alpha_beta(new_state, depth - 1, False, alpha, beta)
+                value = max(value, eval)
+                alpha = max(alpha, value)
 
+                # Alpha-beta pruning
                 if beta <= alpha:
+                    self.nodes_pruned += 1
+                    self.pruning_stats["pruned_nodes"] += 1
+
+                    # Record pruning event for visualization
+                    self.pruning_stats["pruning_events"].append(
+                        {
+                            "depth": current_depth,
+                            "alpha": alpha,
+                            "beta": beta,
+                            "is_maximizing": True,
+                            "value": value,
+                        }
+                    )
+
                     break
 
             return value
@@ -218,135 +321,115 @@ class AlphaBetaAI:
             # Player's turn - minimize score
             value = float("inf")
 
-            # Get all possible moves for player pieces
-            for row in range(len(board)):
-                for col in range(len(board[0])):
-                    if board[row][col] == player_piece:
-                        moves = self.get_valid_moves(
-                            board, row, col, player_piece, ai_piece
-                        )
-                        for to_pos in moves:
-                            # Make a deep copy of the board to simulate the move
-                            new_board = copy.deepcopy(board)
-                            self.make_move(new_board, (row, col), to_pos)
-
-                            # Recursive alpha-beta call
-                            eval = self.alpha_beta(
-                                new_board,
-                                depth - 1,
-                                True,
-                                alpha,
-                                beta,
-                                ai_piece,
-                                player_piece,
-                            )
-                            value = min(value, eval)
-                            beta = min(beta, value)
-
-                            # Alpha-beta pruning
-                            if beta <= alpha:
-                                self.nodes_pruned += 1
-                                self.pruning_stats["pruned_nodes"] += 1
-
-                                # Record pruning event for visualization
-                                self.pruning_stats["pruning_events"].append(
-                                    {
-                                        "depth": current_depth,
-                                        "alpha": alpha,
-                                        "beta": beta,
-                                        "is_maximizing": False,
-                                        "value": value,
-                                    }
-                                )
-
-                                break
-
-                        if beta <= alpha:
-                            break
+            # Try every move of every player piece
+            for new_state in self._child_states(state, False):
+                # Recursive alpha-beta call
+                eval = self.alpha_beta(new_state, depth - 1, True, alpha, beta)
+                value = min(value, eval)
+                beta = min(beta, value)
 
+                # Alpha-beta pruning
                 if beta <= alpha:
+                    self.nodes_pruned += 1
+                    self.pruning_stats["pruned_nodes"] += 1
+
+                    # Record pruning event for visualization
+                    self.pruning_stats["pruning_events"].append(
+                        {
+                            "depth": current_depth,
+                            "alpha": alpha,
+                            "beta": beta,
+                            "is_maximizing": False,
+                            "value": value,
+                        }
+                    )
+
                     break
 
             return value
 
-    def get_valid_moves(self, board, row, col, piece_type, opponent_piece):
-        """Get valid moves for a piece at the given position"""
-        valid_moves = []
-        board_size = len(board)
-
-        # Movement directions based on piece type
-        directions = []
-
-        if piece_type == 1:  # Player piece (moves up)
-            directions = [(-1, 0), (-1, -1), (-1, 1)]
-        elif piece_type == 2:  # AI piece (moves down)
-            directions = [(1, 0), (1, -1), (1, 1)]
-        elif piece_type > 10:  # Special piece
-            directions = [
-                (-1, 0),
-                (1, 0),
-                (0, -1),
-                (0, 1),
-                (-1, -1),
-                (-1, 1),
-                (1, -1),
-                (1, 1),
-            ]
-
-        # Check each direction
-        for d_row, d_col in directions:
-            new_row, new_col = row + d_row, col + d_col
-
-            # Check if position is on the board
-            if 0 <= new_row < board_size and 0 <= new_col < board_size:
-                # Move to empty space
-                if board[new_row][new_col] is None:
-                    valid_moves.append((new_row, new_col))
+    def _load_board(self, board, ai_piece, player_piece):
+        """Set up the search for a board and return it as bitboards"""
+        size = len(board)
+        self._size = size
+        self._ai_moves = _move_table(size, ai_piece)
+        self._player_moves = _move_table(size, player_piece)
+        self._ai_is_one = ai_piece == 1
+        self._setup = (size, ai_piece, player_piece)
+
+        # One bit per square, row-major; any other piece only blocks squares
+        ai_bb = player_bb = blocked_bb = 0
+        for row in range(size):
+            for col in range(size):
+                piece = board[row][col]
+                if piece is None:
+                    continue
+                bit = 1 << (row * size + col)
+                if piece == ai_piece:
+                    ai_bb |= bit
+                elif piece == player_piece:
+                    player_bb |= bit
+                else:
+                    blocked_bb |= bit
+        return ai_bb, player_bb, blocked_bb
+
+    def _child_states(self, state, is_ai):
+        """Yield the states after each move of one side, pieces in board order"""
+        ai_bb, player_bb, blocked_bb = state
+        occupied = ai_bb | player_bb | blocked_bb
+        if is_ai:
+            pieces, opponents, table = ai_bb, player_bb, self._ai_moves
+        else:
+            pieces, opponents, table = player_bb, ai_bb, self._player_moves
+
+        mover = pieces
+        while pieces:
+            from_bit = pieces & -pieces
+            pieces ^= from_bit
+            for to_bit, _, diagonal in table[from_bit.bit_length() - 1]:
+                # Move to empty space, or capture opponent's piece diagonally
+                if not occupied & to_bit or (diagonal and opponents & to_bit):
+                    moved = mover ^ from_bit | to_bit
+                    if is_ai:
+                        yield moved, player_bb & ~to_bit, blocked_bb
+                    else:
+                        yield ai_bb & ~to_bit, moved, blocked_bb
+
+    def get_valid_moves(self, state, from_pos, is_ai):
+        """Get (to_pos, new_state) for each valid move of the piece at from_pos"""
+        ai_bb, player_bb, blocked_bb = state
+        occupied = ai_bb | player_bb | blocked_bb
+        index = from_pos[0] * self._size + from_pos[1]
+        from_bit = 1 << index
+        if is_ai:
+            opponents, table = player_bb, self._ai_moves
+        else:
+            opponents, table = ai_bb, self._player_moves
 
-                # Capture opponent's piece diagonally
-                elif (
-                    abs(d_row) == 1
-                    and abs(d_col) == 1
-                    and board[new_row][new_col] == opponent_piece
-                ):
-                    valid_moves.append((new_row, new_col))
+        valid_moves = []
+        for to_bit, to_pos, diagonal in table[index]:
+            # Move to empty space, or capture opponent's piece diagonally
+            if not occupied & to_bit or (diagonal and opponents & to_bit):
+                if is_ai:
+                    new_state = (ai_bb ^ from_bit | to_bit, player_bb & ~to_bit)
+                else:
+                    new_state = (ai_bb & ~to_bit, player_bb ^ from_bit | to_bit)
+                valid_moves.append((to_pos, new_state + (blocked_bb,)))
 
         return valid_moves
 
-    def make_move(self, board, from_pos, to_pos):
-        """Execute a move on the board"""
-        from_row, from_col = from_pos
-        to_row, to_col = to_pos
-
-        # Move the piece
-        board[to_row][to_col] = board[from_row][from_col]
-        board[from_row][from_col] = None
-
-    def is_terminal_state(self, board):
+    def is_terminal_state(self, state):
         """Check if the current board state is terminal (game over)"""
-        board_size = len(board)
-        player_pieces = 0
-        ai_pieces = 0
+        ai_bb, player_bb, _ = state
+        top_row, bottom_row = _row_masks(self._size)
+
+        # Piece 1 moves up and piece 2 moves down, whichever side holds them
+        ones, twos = (ai_bb, player_bb) if self._ai_is_one else (player_bb, ai_bb)
 
         # Check if either player reached the opponent's side or has no pieces left
-        for row in range(board_size):
-            for col in range(board_size):
-                # Count pieces
-                if board[row][col] == 1:  # Player piece
-                    player_pieces += 1
-                    # Check if player reached the top row
-                    if row == 0:
-                        return True
-                elif board[row][col] == 2:  # AI piece
-                    ai_pieces += 1
-                    # Check if AI reached the bottom row
-                    if row == board_size - 1:
-                        return True
-
-        # Check if either side has no pieces left
-        return player_pieces == 0 or ai_pieces == 0
-
-    def evaluate_board(self, board, ai_piece, player_piece):
+        return bool(ones & top_row or twos & bottom_row) or not ones or not twos
+
+    def evaluate_board(self, state):
         """
         Evaluate the current board state
 
@@ -354,44 +437,33 @@ class AlphaBetaAI:
         - Positive for favorable AI positions
         - Negative for favorable player positions
         """
-        board_size = len(board)
-        score = 0
-
-        # Check for win conditions first
-        for col in range(board_size):
-            # AI reached bottom row (win)
-            if board[board_size - 1][col] == ai_piece:
+        ai_bb, player_bb, _ = state
+        size = self._size
+        top_row, bottom_row = _row_masks(size)
+
+        # Check for win conditions first, column by column with the AI first
+        ai_goal = ai_bb & bottom_row
+        player_goal = player_bb & top_row
+        if ai_goal or player_goal:
+            if not player_goal:
                 return 1000
-            # Player reached top row (loss)
-            if board[0][col] == player_piece:
+            if not ai_goal:
                 return -1000
+            ai_col = (ai_goal & -ai_goal).bit_length() - 1 - size * (size - 1)
+            player_col = (player_goal & -player_goal).bit_length() - 1
+            return 1000 if ai_col <= player_col else -1000
 
-        # Count pieces
-        ai_count = 0
-        player_count = 0
-
-        for row in range(board_size):
-            for col in range(board_size):
-                if board[row][col] == ai_piece:
-                    ai_count += 1
-                    # Reward progress toward the goal (bottom row)
-                    score += row * 2
-
-                    # Reward controlling the center columns
-                    center_bonus = abs(col - board_size // 2)
-                    score -= center_bonus
-
-                elif board[row][col] == player_piece:
-                    player_count += 1
-                    # Penalize player progress toward their goal (top row)
-                    score -= (board_size - row - 1) * 2
-
-                    # Penalize player controlling the center columns
-                    center_bonus = abs(col - board_size // 2)
-                    score += center_bonus
-
-        # Heavily reward piece advantage
-        score += (ai_count - player_count) * 10
+        # Sum progress, center control and piece advantage square by square
+        ai_weights, player_weights = _square_weights(size)
+        score = 0
+        while ai_bb:
+            bit = ai_bb & -ai_bb
+            score += ai_weights[bit.bit_length() - 1]
+            ai_bb ^= bit
+        while player_bb:
+            bit = player_bb & -player_bb
+            score += player_weights[bit.bit_length() - 1]
+            player_bb ^= bit
 
         return score
 
@@ -415,36 +487,34 @@ class AlphaBetaAI:
         # Start from an empty pruning events list
         self.pruning_stats["pruning_events"] = []
 
-        # Run a sample alpha-beta search to generate statistics
+        # Run a sample alpha-beta search to generate statistics, without
+        # transposition table hits so every pruning is shown
         start_time = time.time()
+        table = self.transposition_table
+        self.transposition_table = {}
+        state = self._load_board(board, ai_piece, player_piece)
 
         # Find a valid move
         for row in range(len(board)):
             for col in range(len(board)):
                 if board[row][col] == ai_piece:
-                    moves = self.get_valid_moves(
-                        board, row, col, ai_piece, player_piece
-                    )
+                    moves = self.get_valid_moves(state, (row, col), True)
                     if moves:
-                        # Make a deep copy of the board to simulate the move
-                        new_board = copy.deepcopy(board)
-                        self.make_move(new_board, (row, col), moves[0])
-
                         # Run alpha-beta with reduced depth for visualization
                         self.alpha_beta(
-                            new_board,
+                            moves[0][1],
                             min(3, self.max_depth),
                             False,
                             float("-inf"),
                             float("inf"),
-                            ai_piece,
-                            player_piece,
                         )
                         break
             else:
                 continue
             break
 
+        self.transposition_table = table
+
         # Update time taken
         self.pruning_stats["time_taken"] = time.time() - start_time
 
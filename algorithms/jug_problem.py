@@ -6,6 +6,9 @@ class JugSolver:
         # Maximum states to prevent infinite loops on unsolvable puzzles
         self.max_states = 10000
 
+        # Solutions already found, keyed by (capacities, initial state, target)
+        self._solutions = {}
+
     def solve(self, capacities, initial_state, target):
         """
         Solve the water jug problem using BFS
@@ -18,69 +21,152 @@ class JugSolver:
         Returns:
             List of steps to reach the solution, or empty list if no solution
         """
-        # Initialize BFS
-        queue = deque([(initial_state, [])])  # (state, steps)
-        visited = set([tuple(initial_state)])
+        # Puzzles are deterministic, so a solved position never needs a new search
+        key = (tuple(capacities), tuple(initial_state), target)
+        steps = self._solutions.get(key)
+        if steps is None:
+            steps = self._search(capacities, key[1], target)
+            self._solutions[key] = steps
+        return list(steps)
+
+    def _search(self, capacities, initial_state, target):
+        """Breadth-first search from a state tuple to the target amount"""
+        # Each jug gets its own bit field of one int, so states hash as ints
+        bits = max(max(capacities), max(initial_state), 1).bit_length()
+        mask = (1 << bits) - 1
+        shifts = [i * bits for i in range(len(capacities))]
+        start = sum(amount << shift for amount, shift in zip(initial_state, shifts))
+
+        # The tap and drain sit after the jugs as a full source and an empty
+        # target that never run out, so every move is the same kind of pour
+        unlimited = 1 << bits
+        limits = list(capacities) + [unlimited, unlimited]
+        tap_and_drain = [unlimited, 0]
+        actions = self._build_actions(len(capacities), shifts)
+
+        # Jugs of equal capacity are interchangeable, so states that only
+        # swap their contents are searched once
+        canonical = self._make_canonical(capacities, shifts, mask)
+        seen = None if canonical is None else {canonical(start)}
+
+        # Initialize BFS. Each visited state maps to the (state, move) it was
+        # first reached from, so paths are only rebuilt for the solution
+        queue = deque([start])
+        parents = {start: None}
         states_checked = 0
 
         while queue and states_checked < self.max_states:
-            current_state, steps = queue.popleft()
+            current_state = queue.popleft()
             states_checked += 1
 
             # Check if we've reached the target
-            if target in current_state:
-                return steps
+            amounts = [(current_state >> shift) & mask for shift in shifts]
+            if target in amounts:
+                return self._build_steps(parents, current_state, capacities)
 
             # Generate all possible next states
-            for next_state, action in self._get_next_states(current_state, capacities):
-                state_tuple = tuple(next_state)
-                if state_tuple not in visited:
-                    visited.add(state_tuple)
-                    queue.append((next_state, steps + [action]))
+            amounts += tap_and_drain
+            for next_state, move in self._get_next_states(
+                current_state, amounts, limits, actions
+            ):
+                if next_state in parents:
+                    continue
+                if canonical is not None:
+                    key = canonical(next_state)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                parents[next_state] = (current_state, move)
+                queue.append(next_state)
 
         # No solution found
         return []
 
-    def _get_next_states(self, current_state, capacities):
-        """Generate all possible next states from current state"""
-        next_states = []
+    def _make_canonical(self, capacities, shifts, mask):
+        """
+        Build a function mapping a packed state to the one with the contents
+        of equal-capacity jugs sorted, or None when all capacities differ
+        """
+        groups = {}
+        for capacity, shift in zip(capacities, shifts):
+            groups.setdefault(capacity, []).append(shift)
+        groups = [group for group in groups.values() if len(group) > 1]
+        if not groups:
+            return None
+
+        def canonical(state):
+            for group in groups:
+                amounts = sorted((state >> shift) & mask for shift in group)
+                for shift, amount in zip(group, amounts):
+                    state = state & ~(mask << shift) | (amount << shift)
+            return state
+
+        return canonical
+
+    def _build_steps(self, parents, state, capacities):
+        """Walk parent links back from a solved state to describe its moves"""
+        steps = []
+        while parents[state] is not None:
+            state, move = parents[state]
+            steps.append(self._describe_move(move, capacities))
+        steps.reverse()
+        return steps
+
+    def _build_actions(self, n, shifts):
+        """
+        List every move on n jugs as a (source, target, step, move source,
+        move target) tuple
 
-        # Fill operations
-        for i in range(len(current_state)):
-            if current_state[i] < capacities[i]:
-                new_state = current_state.copy()
-                new_state[i] = capacities[i]
-                action = (
-                    f"Fill jug {i+1}",
-                    f"Fill jug {i+1} to capacity {capacities[i]}",
-                )
-                next_states.append((new_state, action))
-
-        # Empty operations
-        for i in range(len(current_state)):
-            if current_state[i] > 0:
-                new_state = current_state.copy()
-                new_state[i] = 0
-                action = (f"Empty jug {i+1}", f"Empty jug {i+1}")
-                next_states.append((new_state, action))
-
-        # Pour operations
-        for i in range(len(current_state)):
-            for j in range(len(current_state)):
-                if i != j and current_state[i] > 0 and current_state[j] < capacities[j]:
-                    new_state = current_state.copy()
-
-                    # Calculate amount to pour
-                    amount = min(current_state[i], capacities[j] - current_state[j])
-
-                    # Update jugs
-                    new_state[i] -= amount
-                    new_state[j] += amount
-
-                    action = (
-                        f"Pour jug {i+1} into jug {j+1}",
-                        f"Pour {amount}L from jug {i+1} to jug {j+1}",
-                    )
-                    next_states.append((new_state, action))
+        Source and target index the jug amounts, with n for the tap and n + 1
+        for the drain. Step is the change to the packed state per litre
+        moved, and the move source and target use None for the tap and drain.
+        """
+        units = [1 << shift for shift in shifts] + [0, 0]
+        tap, drain = n, n + 1
+        pairs = [(tap, i) for i in range(n)]
+        pairs += [(i, drain) for i in range(n)]
+        pairs += [(i, j) for i in range(n) for j in range(n) if i != j]
+        return [
+            (
+                source,
+                target,
+                units[target] - units[source],
+                None if source == tap else source,
+                None if target == drain else target,
+            )
+            for source, target in pairs
+        ]
+
+    def _get_next_states(self, current_state, amounts, limits, actions):
+        """
+        Generate all possible next states from a packed state
 
+        Amounts and limits hold each jug's contents and capacity followed by
+        the tap and drain. Each move is a (source, target, amount) tuple, where
+        a source of None fills from the tap and a target of None empties into
+        the drain.
+        """
+        next_states = []
+        for source, target, step, move_source, move_target in actions:
+            # Pour as much as the source has and the target can take
+            amount = min(amounts[source], limits[target] - amounts[target])
+            if amount > 0:
+                next_states.append(
+                    (current_state + amount * step, (move_source, move_target, amount))
+                )
         return next_states
+
+    def _describe_move(self, move, capacities):
+        """Get the (short, detailed) hint text for a move"""
+        source, target, amount = move
+        if source is None:
+            return (
+                f"Fill jug {target+1}",
+                f"Fill jug {target+1} to capacity {capacities[target]}",
+            )
+        if target is None:
+            return (f"Empty jug {source+1}", f"Empty jug {source+1}")
+        return (
+            f"Pour jug {source+1} into jug {target+1}",
+            f"Pour {amount}L from jug {source+1} to jug {target+1}",
+        )
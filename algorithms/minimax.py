@@ -1,5 +1,28 @@
 import copy
 import random
+from functools import lru_cache
+from itertools import chain
+
+# Transposition table entry types
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Start over once the table holds this many positions
+MAX_TABLE_SIZE = 200000
+
+# Start over once this many visualization trees are cached
+MAX_TREE_CACHE_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def _board_lines(size):
+    """Cell coordinates of every row, column and diagonal on a board"""
+    rows = [tuple((row, col) for col in range(size)) for row in range(size)]
+    cols = [tuple((row, col) for row in range(size)) for col in range(size)]
+    diagonals = [
+        tuple((i, i) for i in range(size)),
+        tuple((i, size - 1 - i) for i in range(size)),
+    ]
+    return tuple(rows + cols + diagonals)
 
 
 class MinimaxAI:
@@ -8,6 +31,12 @@ class MinimaxAI:
         self.node_count = 0
         self.decision_tree = {}  # For visualization
 
+        # Scores of searched positions, kept across moves and games
+        self.transposition_table = {}
+
+        # Visualization trees of boards already shown, by position and symbols
+        self._decision_trees = {}
+
     def get_best_move(self, board, ai_symbol, player_symbol):
         """
         Find the best move using the minimax algorithm
@@ -22,6 +51,8 @@ class MinimaxAI:
         """
         # Reset node count for tracking algorithm efficiency
         self.node_count = 0
+        if len(self.transposition_table) > MAX_TABLE_SIZE:
+            self.transposition_table.clear()
 
         # Get all available moves
         moves = self._get_available_moves(board)
@@ -35,17 +66,17 @@ class MinimaxAI:
         best_score = float("-inf")
         best_move = None
 
+        # Moves are made and undone in place on a private copy of the board
+        board = [row[:] for row in board]
+
         # Try each available move
         for move in moves:
             row, col = move
 
-            # Make a deep copy of the board to simulate the move
-            new_board = copy.deepcopy(board)
-            new_board[row][col] = ai_symbol
-
             # Calculate score for this move using minimax
+            board[row][col] = ai_symbol
             score = self._minimax(
-                new_board,
+                board,
                 0,
                 False,  # Next turn is minimizing player
                 float("-inf"),
@@ -53,6 +84,7 @@ class MinimaxAI:
                 ai_symbol,
                 player_symbol,
             )
+            board[row][col] = None
 
             # Update best move if better score found
             if score > best_score:
@@ -71,6 +103,15 @@ class MinimaxAI:
         Returns:
             Dictionary representing the minimax decision tree
         """
+        # Reuse the tree if this position has been shown before
+        key = (tuple(chain.from_iterable(board)), ai_symbol, player_symbol)
+        tree = self._decision_trees.get(key)
+        if tree is not None:
+            self.decision_tree = tree
+            return tree
+        if len(self._decision_trees) > MAX_TREE_CACHE_SIZE:
+            self._decision_trees.clear()
+
         # Reset decision tree
         self.decision_tree = {
             "board": copy.deepcopy(board),
@@ -135,6 +176,7 @@ class MinimaxAI:
                 child["score"] for child in self.decision_tree["children"]
             )
 
+        self._decision_trees[key] = self.decision_tree
         return self.decision_tree
 
     def _minimax(
@@ -158,6 +200,44 @@ class MinimaxAI:
         # Increment node count for measuring algorithm efficiency
         self.node_count += 1
 
+        # Reuse the score of a position already searched at this depth. The
+        # board is flattened so each key is a single tuple rather than one per row
+        key = (
+            tuple(chain.from_iterable(board)),
+            depth,
+            is_maximizing,
+            ai_symbol,
+            player_symbol,
+            self.max_depth,
+        )
+        entry = self.transposition_table.get(key)
+        if entry is not None:
+            score, bound = entry
+            if (
+                bound == EXACT
+                or (bound == LOWER_BOUND and score >= beta)
+                or (bound == UPPER_BOUND and score <= alpha)
+            ):
+                return score
+
+        score = self._search(
+            board, depth, is_maximizing, alpha, beta, ai_symbol, player_symbol
+        )
+
+        if score <= alpha:
+            bound = UPPER_BOUND
+        elif score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.transposition_table[key] = (score, bound)
+
+        return score
+
+    def _search(
+        self, board, depth, is_maximizing, alpha, beta, ai_symbol, player_symbol
+    ):
+        """Search a position that isn't in the transposition table"""
         # Check terminal states
         winner = self._check_winner(board)
         if winner:
@@ -177,14 +257,12 @@ class MinimaxAI:
             for move in available_moves:
                 row, col = move
 
-                # Make move
-                new_board = copy.deepcopy(board)
-                new_board[row][col] = ai_symbol
-
-                # Recursive minimax call
+                # Make move, search it and undo it
+                board[row][col] = ai_symbol
                 score = self._minimax(
-                    new_board, depth + 1, False, alpha, beta, ai_symbol, player_symbol
+                    board, depth + 1, False, alpha, beta, ai_symbol, player_symbol
                 )
+                board[row][col] = None
 
                 best_score = max(score, best_score)
 
@@ -200,14 +278,12 @@ class MinimaxAI:
             for move in available_moves:
                 row, col = move
 
-                # Make move
-                new_board = copy.deepcopy(board)
-                new_board[row][col] = player_symbol
-
-                # Recursive minimax call
+                # Make move, search it and undo it
+                board[row][col] = player_symbol
                 score = self._minimax(
-                    new_board, depth + 1, True, alpha, beta, ai_symbol, player_symbol
+                    board, depth + 1, True, alpha, beta, ai_symbol, player_symbol
                 )
+                board[row][col] = None
 
                 best_score = min(score, best_score)
 
@@ -220,15 +296,12 @@ class MinimaxAI:
 
     def _get_available_moves(self, board):
         """Get all available moves on the board"""
-        size = len(board)
-        moves = []
-
-        for row in range(size):
-            for col in range(size):
-                if board[row][col] is None:
-                    moves.append((row, col))
-
-        return moves
+        return [
+            (row, col)
+            for row, cells in enumerate(board)
+            for col, cell in enumerate(cells)
+            if cell is None
+        ]
 
     def _is_board_full(self, board):
         """Check if the board is full"""
@@ -240,33 +313,12 @@ class MinimaxAI:
 
     def _check_winner(self, board):
         """Check if there's a winner on the board"""
-        size = len(board)
-
-        # Check rows
-        for row in range(size):
-            if board[row][0] is not None and all(
-                board[row][j] == board[row][0] for j in range(size)
-            ):
-                return board[row][0]
-
-        # Check columns
-        for col in range(size):
-            if board[0][col] is not None and all(
-                board[i][col] == board[0][col] for i in range(size)
-            ):
-                return board[0][col]
-
-        # Check main diagonal
-        if board[0][0] is not None and all(
-            board[i][i] == board[0][0] for i in range(size)
-        ):
-            return board[0][0]
-
-        # Check other diagonal
-        if board[0][size - 1] is not None and all(
-            board[i][size - 1 - i] == board[0][size - 1] for i in range(size)
-        ):
-            return board[0][size - 1]
+        # Check rows, columns and diagonals in order
+        for line in _board_lines(len(board)):
+            row, col = line[0]
+            first = board[row][col]
+            if first is not None and all(board[r][c] == first for r, c in line):
+                return first
 
         # No winner
         return None
@@ -291,29 +343,11 @@ class MinimaxAI:
             return -10
 
         # Check rows, columns, diagonals for potential wins
-
-        # Evaluate rows
-        for row in range(size):
+        for line in _board_lines(size):
             score += self._evaluate_line(
-                [board[row][col] for col in range(size)], ai_symbol, player_symbol
+                [board[r][c] for r, c in line], ai_symbol, player_symbol
             )
 
-        # Evaluate columns
-        for col in range(size):
-            score += self._evaluate_line(
-                [board[row][col] for row in range(size)], ai_symbol, player_symbol
-            )
-
-        # Evaluate main diagonal
-        score += self._evaluate_line(
-            [board[i][i] for i in range(size)], ai_symbol, player_symbol
-        )
-
-        # Evaluate other diagonal
-        score += self._evaluate_line(
-            [board[i][size - 1 - i] for i in range(size)], ai_symbol, player_symbol
-        )
-
         # Bonus for center in 3x3 board
         if size == 3 and board[1][1] == ai_symbol:
             score += 2
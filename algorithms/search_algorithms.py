@@ -1,10 +1,21 @@
 from collections import deque
 
 
+def pack_grid(grid):
+    """Pack a 2D grid into an int with one set bit per wall cell, row-major"""
+    width = len(grid[0])
+    walls = 0
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell != 0:
+                walls |= 1 << (y * width + x)
+    return walls
+
+
 class BFS:
     """Breadth-First Search algorithm for pathfinding"""
 
-    def find_path(self, grid, start, goal):
+    def find_path(self, grid, start, goal, grid_bits=None, parents=None):
         """
         Find path from start to goal using BFS
 
@@ -12,19 +23,27 @@ class BFS:
             grid: 2D list where 0 is path and 1 is wall
             start: Tuple (x, y) of starting position
             goal: Tuple (x, y) of goal position
+            grid_bits: The grid already packed by pack_grid, if available
+            parents: List of width * height ints to reuse for parent links
 
         Returns:
             path: List of tuples representing the path from start to goal
-            visited: Set of all cells visited during the search
+            visited: Bitmap of cells visited during the search, indexed y * width + x
         """
-        # Check if start or goal is a wall
-        if grid[start[1]][start[0]] == 1 or grid[goal[1]][goal[0]] == 1:
-            return [], set()
-
         # Get grid dimensions
         height = len(grid)
         width = len(grid[0])
 
+        # Test walls as bits of one int rather than indexing the grid
+        walls = pack_grid(grid) if grid_bits is None else grid_bits
+
+        # Check if start or goal is a wall
+        if (
+            walls >> (start[1] * width + start[0]) & 1
+            or walls >> (goal[1] * width + goal[0]) & 1
+        ):
+            return [], bytearray(width * height)
+
         # Direction vectors (up, right, down, left)
         directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
 
@@ -32,43 +51,47 @@ class BFS:
         queue = deque([start])
 
         # Track visited cells and previous cells for path reconstruction
-        visited = {start}
-        previous = {start: None}
+        visited = bytearray(width * height)
+        visited[start[1] * width + start[0]] = 1
+        previous = [0] * (width * height) if parents is None else parents
 
         while queue:
             current = queue.popleft()
 
             # If we reached the goal, reconstruct and return the path
             if current == goal:
-                return self._reconstruct_path(previous, start, goal), visited
+                return self._reconstruct_path(previous, start, goal, width), visited
 
             # Try all four directions
+            x, y = current
+            current_index = y * width + x
             for dy, dx in directions:
-                ny, nx = current[1] + dy, current[0] + dx
-                next_cell = (nx, ny)
+                ny, nx = y + dy, x + dx
+                index = ny * width + nx
 
                 # Check if next cell is valid
                 if (
                     0 <= nx < width
                     and 0 <= ny < height
-                    and grid[ny][nx] == 0
-                    and next_cell not in visited
+                    and not walls >> index & 1
+                    and not visited[index]
                 ):
-
+                    next_cell = (nx, ny)
                     queue.append(next_cell)
-                    visited.add(next_cell)
-                    previous[next_cell] = current
+                    visited[index] = 1
+                    previous[index] = current_index
 
         # No path found
         return [], visited
 
-    def _reconstruct_path(self, previous, start, goal):
-        """Reconstruct path from start to goal using the previous dictionary"""
+    def _reconstruct_path(self, previous, start, goal, width):
+        """Reconstruct path from start to goal using the previous cell indices"""
         path = []
-        current = goal
+        current = goal[1] * width + goal[0]
+        start_index = start[1] * width + start[0]
 
-        while current != start:
-            path.append(current)
+        while current != start_index:
+            path.append((current % width, current // width))
             current = previous[current]
 
         path.append(start)
@@ -79,7 +102,7 @@ class BFS:
 class DFS:
     """Depth-First Search algorithm for pathfinding"""
 
-    def find_path(self, grid, start, goal):
+    def find_path(self, grid, start, goal, grid_bits=None, parents=None):
         """
         Find path from start to goal using DFS
 
@@ -87,19 +110,27 @@ class DFS:
             grid: 2D list where 0 is path and 1 is wall
             start: Tuple (x, y) of starting position
             goal: Tuple (x, y) of goal position
+            grid_bits: The grid already packed by pack_grid, if available
+            parents: List of width * height ints to reuse for parent links
 
         Returns:
             path: List of tuples representing the path from start to goal
-            visited: Set of all cells visited during the search
+            visited: Bitmap of cells visited during the search, indexed y * width + x
         """
-        # Check if start or goal is a wall
-        if grid[start[1]][start[0]] == 1 or grid[goal[1]][goal[0]] == 1:
-            return [], set()
-
         # Get grid dimensions
         height = len(grid)
         width = len(grid[0])
 
+        # Test walls as bits of one int rather than indexing the grid
+        walls = pack_grid(grid) if grid_bits is None else grid_bits
+
+        # Check if start or goal is a wall
+        if (
+            walls >> (start[1] * width + start[0]) & 1
+            or walls >> (goal[1] * width + goal[0]) & 1
+        ):
+            return [], bytearray(width * height)
+
         # Direction vectors (up, right, down, left)
         directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
 
@@ -107,43 +138,47 @@ class DFS:
         stack = [start]
 
         # Track visited cells and previous cells for path reconstruction
-        visited = {start}
-        previous = {start: None}
+        visited = bytearray(width * height)
+        visited[start[1] * width + start[0]] = 1
+        previous = [0] * (width * height) if parents is None else parents
 
         while stack:
             current = stack.pop()
 
             # If we reached the goal, reconstruct and return the path
             if current == goal:
-                return self._reconstruct_path(previous, start, goal), visited
+                return self._reconstruct_path(previous, start, goal, width), visited
 
             # Try all four directions
+            x, y = current
+            current_index = y * width + x
             for dy, dx in directions:
-                ny, nx = current[1] + dy, current[0] + dx
-                next_cell = (nx, ny)
+                ny, nx = y + dy, x + dx
+                index = ny * width + nx
 
                 # Check if next cell is valid
                 if (
                     0 <= nx < width
                     and 0 <= ny < height
-                    and grid[ny][nx] == 0
-                    and next_cell not in visited
+                    and not walls >> index & 1
+                    and not visited[index]
                 ):
-
+                    next_cell = (nx, ny)
                     stack.append(next_cell)
-                    visited.add(next_cell)
-                    previous[next_cell] = current
+                    visited[index] = 1
+                    previous[index] = current_index
 
         # No path found
         return [], visited
 
-    def _reconstruct_path(self, previous, start, goal):
-        """Reconstruct path from start to goal using the previous dictionary"""
+    def _reconstruct_path(self, previous, start, goal, width):
+        """Reconstruct path from start to goal using the previous cell indices"""
         path = []
-        current = goal
+        current = goal[1] * width + goal[0]
+        start_index = start[1] * width + start[0]
 
-        while current != start:
-            path.append(current)
+        while current != start_index:
+            path.append((current % width, current // width))
             current = previous[current]
 
         path.append(start)
@@ -32,3 +32,7 @@ class GameEngine:
         
         # Render current state
         self.state_manager.render(self.screen)
+
+    def get_dirty_rects(self):
+        """Return the screen regions changed by the last render, or None for all"""
+        return self.state_manager.get_dirty_rects()
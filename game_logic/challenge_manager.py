@@ -7,18 +7,21 @@ class ChallengeManager:
         self.challenges = []
         self.current_challenge_index = 0
 
+        # Challenge generators keyed by the type they produce
+        self._challenge_generators = {
+            "maze": self._generate_maze_challenge,
+            "water_jug": self._generate_water_jug_challenge,
+            "tictactoe": self._generate_tictactoe_challenge,
+            "strategy": self._generate_strategy_challenge,
+        }
+
         # Generate challenges based on difficulty
         self._generate_challenges()
 
     def _generate_challenges(self):
         """Generate a sequence of challenges"""
         # Base challenges that will be included
-        base_challenges = [
-            self._generate_maze_challenge,
-            self._generate_water_jug_challenge,
-            self._generate_tictactoe_challenge,
-            self._generate_strategy_challenge,
-        ]
+        base_challenges = list(self._challenge_generators.values())
 
         # Set total number of challenges based on difficulty
         if self.difficulty == 1:
@@ -169,16 +172,8 @@ class ChallengeManager:
     def _generate_integration_challenge(self):
         """Create an integration challenge that combines multiple algorithms"""
         # Pick a base challenge type for the integration challenge
-        base_type = random.choice(["maze", "water_jug", "tictactoe", "strategy"])
-
-        if base_type == "maze":
-            challenge = self._generate_maze_challenge()
-        elif base_type == "water_jug":
-            challenge = self._generate_water_jug_challenge()
-        elif base_type == "tictactoe":
-            challenge = self._generate_tictactoe_challenge()
-        else:  # strategy
-            challenge = self._generate_strategy_challenge()
+        base_type = random.choice(list(self._challenge_generators))
+        challenge = self._challenge_generators[base_type]()
 
         # Modify it to be an integration challenge
         challenge["type"] = "integration"
@@ -48,6 +48,10 @@ class GameState:
         """Render the state"""
         pass
 
+    def get_dirty_rects(self):
+        """Return the screen regions changed by the last render, or None for all"""
+        return None
+
 
 class MenuState(GameState):
     def __init__(self, game_engine, asset_manager):
@@ -162,6 +166,11 @@ class PlayState(GameState):
             )
             screen.blit(sub_text, sub_rect)
 
+    def get_dirty_rects(self):
+        if self.current_level:
+            return self.current_level.get_dirty_rects()
+        return None
+
 
 class SettingsState(GameState):
     def __init__(self, game_engine, asset_manager):
@@ -281,3 +290,9 @@ class GameStateManager:
         elif self.current_state:
             # Render the current state
             self.states[self.current_state].render(screen)
+
+    def get_dirty_rects(self):
+        """Return the screen regions changed by the last render, or None for all"""
+        if self.screen_manager.is_transitioning() or not self.current_state:
+            return None
+        return self.states[self.current_state].get_dirty_rects()
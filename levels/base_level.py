@@ -19,6 +19,10 @@ class BaseLevel:
         """Render the level"""
         pass
 
+    def get_dirty_rects(self):
+        """Return the screen regions changed by the last render, or None for all"""
+        return None
+
     def reset(self):
         """Reset the level to its initial state"""
         self.completed = False
@@ -3,6 +3,9 @@ import random
 import math
 import time
 import heapq
+import numpy as np
+from functools import partial
+from itertools import groupby
 from levels.base_level import BaseLevel
 from settings import (
     SCREEN_WIDTH,
@@ -14,6 +17,7 @@ from settings import (
     BLUE,
     YELLOW,
     LIGHT_BLUE,
+    GRAY,
 )
 
 
@@ -28,6 +32,16 @@ class IntegrationLevel(BaseLevel):
         self.grid_size = 16  # Reduced from 20
         self.cell_size = 28  # Reduced from 30
 
+        # Board geometry is fixed, so precompute cell positions once
+        self.board_width = self.grid_size * self.cell_size
+        self.board_height = self.grid_size * self.cell_size
+        self.board_left = (SCREEN_WIDTH - self.board_width) // 2
+        self.board_top = 50
+        self._px = [self.board_left + x * self.cell_size for x in range(self.grid_size)]
+        self._py = [self.board_top + y * self.cell_size for y in range(self.grid_size)]
+        self._cx = [px + self.cell_size // 2 for px in self._px]
+        self._cy = [py + self.cell_size // 2 for py in self._py]
+
         # Initialize the game state
         self.reset()
 
@@ -39,6 +53,41 @@ class IntegrationLevel(BaseLevel):
         self.moves_made = 0  # Track total moves made
         self.optimal_path_length = 0  # Length of optimal path
 
+        # Movement handler for each enemy type; anything else moves randomly
+        self._enemy_movers = {
+            "hunter": self._move_hunter,
+            "patrol": self._move_patrol,
+            "random": self._move_random,
+        }
+
+        # Actions for each key during play
+        self._key_handlers = {
+            key: partial(self._handle_movement, key)
+            for key in (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT)
+        }
+        self._key_handlers[pygame.K_SPACE] = self._toggle_path
+        self._key_handlers[pygame.K_c] = self._toggle_collecting_mode
+        for key, name, use in (
+            (pygame.K_1, "teleport", self._use_teleport),
+            (pygame.K_2, "reveal_path", self._use_reveal_path),
+            (pygame.K_3, "freeze_enemies", self._use_freeze_enemies),
+        ):
+            self._key_handlers[key] = partial(self._try_power_up, name, use)
+
+        # Display-format surfaces, built on the first render
+        self._enemy_sprites = None
+        self._overlays = None
+
+        # Controls help never changes
+        controls = [
+            "Controls:",
+            "Arrow keys: Move",
+            "Space: Toggle path",
+            "C: Toggle collection mode",
+            "1-3: Use power-ups",
+        ]
+        self._control_texts = [self.font.render(text, True, WHITE) for text in controls]
+
     def reset(self):
         """Reset the level to initial state"""
         super().reset()
@@ -57,10 +106,15 @@ class IntegrationLevel(BaseLevel):
         self.collecting_mode = False
 
         # Generate the maze with walls and collectibles
+        self._path_cache = {}
         self._generate_maze()
 
+        # Open interior cells as a (row, col) array, used for teleport targets
+        self._open_cells = np.argwhere(np.array(self.grid)[1:-1, 1:-1] == 0) + 1
+
         # Items and enemies
         self.collectibles = []
+        self._collected_count = 0
         self.enemies = []
         self._place_collectibles(15 + self.difficulty * 5)
         self._generate_enemies(3 + self.difficulty)
@@ -76,6 +130,7 @@ class IntegrationLevel(BaseLevel):
             self.difficulty * 15
         )  # Decreasing time with difficulty
         self.time_remaining = self.time_limit
+        self._inv_time_limit = 1.0 / self.time_limit
         self.completed = False
 
         # UI elements
@@ -84,6 +139,8 @@ class IntegrationLevel(BaseLevel):
 
         # Power-ups
         self.power_ups = {"teleport": 1, "reveal_path": 2, "freeze_enemies": 1}
+        self._power_up_count = sum(self.power_ups.values())
+        self._hud_dirty = True
         self.freeze_time = 0
         self.reveal_time = 0
 
@@ -91,6 +148,17 @@ class IntegrationLevel(BaseLevel):
         self.win_rate = 50.0
         self.moves_made = 0
 
+        # Render caches - the background is built lazily on the first render
+        self._background = None
+        self._prev_entity_rects = None
+        self._prev_drawn_path = []
+        self._dirty_rects = None
+        self._stat_texts = {}
+
+        # Set whenever something visible changes; otherwise the last frame is reused
+        self._dirty = True
+        self._shown_clock = None
+
     def set_difficulty(self, level):
         """Set the difficulty level"""
         self.difficulty = max(1, min(level, 4))  # Clamp between 1-4
@@ -219,6 +287,9 @@ class IntegrationLevel(BaseLevel):
             # Update current position
             current = (next_y, next_x)
 
+        # Paths found before the walls were cleared are stale
+        self._path_cache.clear()
+
     def _place_collectibles(self, count):
         """Place collectibles around the maze"""
         self.collectibles = []
@@ -244,6 +315,9 @@ class IntegrationLevel(BaseLevel):
                 )
                 empty_cells.remove(pos)
 
+        # Reciprocal used by the win rate calculation
+        self._inv_total_items = 1.0 / max(len(self.collectibles), 1)
+
     def _generate_enemies(self, count):
         """Generate enemies with different behaviors"""
         self.enemies = []
@@ -326,8 +400,17 @@ class IntegrationLevel(BaseLevel):
         # Calculate initial optimal path length for win rate calculation
         path = self._find_path_astar(self.player_pos, self.target_pos)
         self.optimal_path_length = len(path) if path else self.grid_size * 2
+        self._inv_opt_len = 1.0 / (self.optimal_path_length * 1.5)
 
     def _find_path_astar(self, start, end):
+        """Find path using A*, reusing earlier results while the maze is unchanged"""
+        key = (start, end)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._path_cache[key] = self._search_astar(start, end)
+        return path
+
+    def _search_astar(self, start, end):
         """Find path using A* algorithm"""
         if start == end:
             return [start]
@@ -378,6 +461,9 @@ class IntegrationLevel(BaseLevel):
 
     def handle_event(self, event):
         """Handle user input"""
+        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            self._dirty = True
+
         # Handle instructions modal first
         if self.show_instructions:
             if event.type == pygame.KEYDOWN or (
@@ -394,41 +480,35 @@ class IntegrationLevel(BaseLevel):
             return
 
         if event.type == pygame.KEYDOWN:
-            # Movement
-            if event.key in [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]:
-                self._handle_movement(event.key)
-
-            # Toggle path visualization
-            elif event.key == pygame.K_SPACE:
-                self.show_path = not self.show_path
-                if self.show_path:
-                    self.current_path = self._find_path_astar(
-                        self.player_pos, self.target_pos
-                    )
+            handler = self._key_handlers.get(event.key)
+            if handler:
+                handler()
+
+    def _toggle_path(self):
+        """Toggle path visualization"""
+        self.show_path = not self.show_path
+        if self.show_path:
+            self.current_path = self._find_path_astar(self.player_pos, self.target_pos)
 
-            # Toggle collectible mode
-            elif event.key == pygame.K_c:
-                self.collecting_mode = not self.collecting_mode
-                if self.collecting_mode:
-                    # Find nearest collectible
-                    nearest = self._find_nearest_collectible()
-                    if nearest:
-                        self.current_path = self._find_path_astar(
-                            self.player_pos, nearest["pos"]
-                        )
-                else:
-                    # Path to target
-                    self.current_path = self._find_path_astar(
-                        self.player_pos, self.target_pos
-                    )
+    def _toggle_collecting_mode(self):
+        """Toggle collectible mode"""
+        self.collecting_mode = not self.collecting_mode
+        self._hud_dirty = True
+        if self.collecting_mode:
+            # Find nearest collectible
+            nearest = self._find_nearest_collectible()
+            if nearest:
+                self.current_path = self._find_path_astar(
+                    self.player_pos, nearest["pos"]
+                )
+        else:
+            # Path to target
+            self.current_path = self._find_path_astar(self.player_pos, self.target_pos)
 
-            # Use power-ups
-            elif event.key == pygame.K_1 and self.power_ups["teleport"] > 0:
-                self._use_teleport()
-            elif event.key == pygame.K_2 and self.power_ups["reveal_path"] > 0:
-                self._use_reveal_path()
-            elif event.key == pygame.K_3 and self.power_ups["freeze_enemies"] > 0:
-                self._use_freeze_enemies()
+    def _try_power_up(self, name, use):
+        """Use a power-up if any are left"""
+        if self.power_ups[name] > 0:
+            use()
 
     def _handle_movement(self, key):
         """Handle player movement"""
@@ -493,12 +573,15 @@ class IntegrationLevel(BaseLevel):
         for item in self.collectibles:
             if not item["collected"] and item["pos"] == self.player_pos:
                 item["collected"] = True
+                self._collected_count += 1
                 self.player_score += item["value"]
 
                 # Chance to get a power-up
                 if random.random() < 0.3:
                     power_up = random.choice(list(self.power_ups.keys()))
                     self.power_ups[power_up] += 1
+                    self._power_up_count += 1
+                    self._hud_dirty = True
 
     def _find_nearest_collectible(self):
         """Find the nearest uncollected collectible"""
@@ -517,22 +600,13 @@ class IntegrationLevel(BaseLevel):
     def _use_teleport(self):
         """Use teleport power-up"""
         self.power_ups["teleport"] -= 1
+        self._power_up_count -= 1
+        self._hud_dirty = True
 
-        # Find a safe spot to teleport to
-        empty_cells = []
-        for y in range(1, self.grid_size - 1):
-            for x in range(1, self.grid_size - 1):
-                if self.grid[y][x] == 0 and (y, x) != self.player_pos:
-                    # Make sure it's not too close to enemies
-                    safe = True
-                    for enemy in self.enemies:
-                        ey, ex = enemy["pos"]
-                        if abs(y - ey) + abs(x - ex) < 3:
-                            safe = False
-                            break
-
-                    if safe:
-                        empty_cells.append((y, x))
+        # Find a safe spot to teleport to, not too close to enemies
+        empty_cells = [
+            cell for cell in self._cells_away_from_enemies(3) if cell != self.player_pos
+        ]
 
         if empty_cells:
             # Pick a cell that's closer to the target if possible
@@ -565,6 +639,8 @@ class IntegrationLevel(BaseLevel):
     def _use_reveal_path(self):
         """Use reveal path power-up"""
         self.power_ups["reveal_path"] -= 1
+        self._power_up_count -= 1
+        self._hud_dirty = True
         self.show_path = True
         self.reveal_time = 10.0  # Show path for 10 seconds
 
@@ -578,6 +654,8 @@ class IntegrationLevel(BaseLevel):
     def _use_freeze_enemies(self):
         """Use freeze enemies power-up"""
         self.power_ups["freeze_enemies"] -= 1
+        self._power_up_count -= 1
+        self._hud_dirty = True
         self.freeze_time = 8.0  # Freeze for 8 seconds
 
     def _find_collecting_path(self):
@@ -632,14 +710,24 @@ class IntegrationLevel(BaseLevel):
         if self.time_remaining <= 0:
             self.time_remaining = 0
             self.game_over = True
+            self._dirty = True
+
+        # The clock only shows whole seconds and turns red under 30
+        clock = (int(self.time_remaining), self.time_remaining > 30)
+        if clock != self._shown_clock:
+            self._shown_clock = clock
+            self._dirty = True
 
         # Update power-up timers
         if self.freeze_time > 0:
             self.freeze_time -= dt
+            if self.freeze_time <= 0:
+                self._dirty = True
         if self.reveal_time > 0:
             self.reveal_time -= dt
             if self.reveal_time <= 0:
                 self.show_path = False
+                self._dirty = True
 
         # Update enemies if not frozen
         if self.freeze_time <= 0:
@@ -650,86 +738,94 @@ class IntegrationLevel(BaseLevel):
                 if enemy["move_timer"] >= 1.0:
                     enemy["move_timer"] = 0
                     self._move_enemy(enemy)
+                    self._dirty = True
 
         # Check if player was caught by enemy
         self._check_enemy_collision()
 
     def _move_enemy(self, enemy):
         """Move an enemy based on its type"""
+        self._enemy_movers.get(enemy["type"], self._move_random)(enemy)
+
+    def _move_hunter(self, enemy):
+        """Move a hunter toward the player"""
         y, x = enemy["pos"]
 
-        if enemy["type"] == "hunter":
-            # Hunter enemies try to move toward the player
-            if random.random() < self.enemy_intelligence:
-                # Use pathfinding
-                path = self._find_path_astar(enemy["pos"], self.player_pos)
-                if path and len(path) > 1:
-                    enemy["pos"] = path[1]
-                    return
-
-            # Fallback - move toward player
-            py, px = self.player_pos
-            moves = []
-
-            # Try to move closer to player
-            if py < y and self.grid[y - 1][x] != 1:
-                moves.append((y - 1, x))
-            if py > y and self.grid[y + 1][x] != 1:
-                moves.append((y + 1, x))
-            if px < x and self.grid[y][x - 1] != 1:
-                moves.append((y, x - 1))
-            if px > x and self.grid[y][x + 1] != 1:
-                moves.append((y, x + 1))
-
-            # If no good moves, try any valid move
-            if not moves:
-                for dy, dx in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    ny, nx = y + dy, x + dx
-                    if (
-                        0 <= ny < self.grid_size
-                        and 0 <= nx < self.grid_size
-                        and self.grid[ny][nx] != 1
-                    ):
-                        moves.append((ny, nx))
-
-            if moves:
-                enemy["pos"] = random.choice(moves)
-
-        elif enemy["type"] == "patrol":
-            # Patrol enemies follow a predetermined path
-            if not enemy["patrol_points"]:
+        # Hunter enemies try to move toward the player
+        if random.random() < self.enemy_intelligence:
+            # Use pathfinding
+            path = self._find_path_astar(enemy["pos"], self.player_pos)
+            if path and len(path) > 1:
+                enemy["pos"] = path[1]
                 return
 
-            # Get next patrol point
-            next_idx = enemy["patrol_index"] + enemy["patrol_direction"]
-
-            # Check bounds and reverse if needed
-            if next_idx < 0 or next_idx >= len(enemy["patrol_points"]):
-                enemy["patrol_direction"] *= -1
-                next_idx = enemy["patrol_index"] + enemy["patrol_direction"]
-
-            # Update position and index
-            enemy["pos"] = enemy["patrol_points"][next_idx]
-            enemy["patrol_index"] = next_idx
-
-        else:  # Random movement
-            # Try to move in a random direction
-            for _ in range(4):
-                dy, dx = random.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
+        # Fallback - move toward player
+        py, px = self.player_pos
+        moves = []
+
+        # Try to move closer to player
+        if py < y and self.grid[y - 1][x] != 1:
+            moves.append((y - 1, x))
+        if py > y and self.grid[y + 1][x] != 1:
+            moves.append((y + 1, x))
+        if px < x and self.grid[y][x - 1] != 1:
+            moves.append((y, x - 1))
+        if px > x and self.grid[y][x + 1] != 1:
+            moves.append((y, x + 1))
+
+        # If no good moves, try any valid move
+        if not moves:
+            for dy, dx in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                 ny, nx = y + dy, x + dx
-
                 if (
                     0 <= ny < self.grid_size
                     and 0 <= nx < self.grid_size
                     and self.grid[ny][nx] != 1
                 ):
-                    enemy["pos"] = (ny, nx)
-                    break
+                    moves.append((ny, nx))
+
+        if moves:
+            enemy["pos"] = random.choice(moves)
+
+    def _move_patrol(self, enemy):
+        """Move a patrol enemy along its predetermined path"""
+        if not enemy["patrol_points"]:
+            return
+
+        # Get next patrol point
+        next_idx = enemy["patrol_index"] + enemy["patrol_direction"]
+
+        # Check bounds and reverse if needed
+        if next_idx < 0 or next_idx >= len(enemy["patrol_points"]):
+            enemy["patrol_direction"] *= -1
+            next_idx = enemy["patrol_index"] + enemy["patrol_direction"]
+
+        # Update position and index
+        enemy["pos"] = enemy["patrol_points"][next_idx]
+        enemy["patrol_index"] = next_idx
+
+    def _move_random(self, enemy):
+        """Move an enemy one step in a random direction"""
+        y, x = enemy["pos"]
+
+        # Try to move in a random direction
+        for _ in range(4):
+            dy, dx = random.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
+            ny, nx = y + dy, x + dx
+
+            if (
+                0 <= ny < self.grid_size
+                and 0 <= nx < self.grid_size
+                and self.grid[ny][nx] != 1
+            ):
+                enemy["pos"] = (ny, nx)
+                break
 
     def _check_enemy_collision(self):
         """Check if player collided with an enemy"""
         for enemy in self.enemies:
             if enemy["pos"] == self.player_pos:
+                self._dirty = True
                 self.player_score -= 50
                 self.moves_remaining = max(0, self.moves_remaining - 10)
 
@@ -739,22 +835,8 @@ class IntegrationLevel(BaseLevel):
 
     def _emergency_teleport(self):
         """Teleport player after enemy collision"""
-        safe_cells = []
-
         # Find cells that are empty and away from enemies
-        for y in range(1, self.grid_size - 1):
-            for x in range(1, self.grid_size - 1):
-                if self.grid[y][x] == 0:
-                    # Check distance from enemies
-                    safe = True
-                    for enemy in self.enemies:
-                        ey, ex = enemy["pos"]
-                        if abs(y - ey) + abs(x - ex) < 5:
-                            safe = False
-                            break
-
-                    if safe:
-                        safe_cells.append((y, x))
+        safe_cells = self._cells_away_from_enemies(5)
 
         if safe_cells:
             self.player_pos = random.choice(safe_cells)
@@ -762,6 +844,15 @@ class IntegrationLevel(BaseLevel):
             # If no safe cells, try to move closer to target
             self.player_pos = self._find_safer_spot()
 
+    def _cells_away_from_enemies(self, min_distance):
+        """Get the open cells at least min_distance steps from every enemy"""
+        cells = self._open_cells
+        if self.enemies:
+            enemy_pos = np.array([enemy["pos"] for enemy in self.enemies])
+            distances = np.abs(cells[:, None, :] - enemy_pos[None, :, :]).sum(axis=2)
+            cells = cells[(distances >= min_distance).all(axis=1)]
+        return [tuple(cell) for cell in cells.tolist()]
+
     def _find_safer_spot(self):
         """Find a safer spot when no completely safe spots exist"""
         current_y, current_x = self.player_pos
@@ -791,32 +882,34 @@ class IntegrationLevel(BaseLevel):
 
     def render(self, screen):
         """Render the game"""
-        # Fill background
-        screen.fill((20, 30, 40))
+        board_left, board_top = self.board_left, self.board_top
+        board_width, board_height = self.board_width, self.board_height
+        cx, cy = self._cx, self._cy
 
-        # Draw title
-        title = self.title_font.render("PATHFINDER ADVENTURE", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 10))
+        # Background, title and maze only change on reset; caches need a display
+        self._ensure_caches()
+
+        # Nothing changed since the last frame, so redraw it and present nothing
+        if not self._dirty:
+            screen.blit(self._frame, (0, 0))
+            self._dirty_rects = []
+            return
 
-        # Calculate board dimensions
-        board_width = self.grid_size * self.cell_size
-        board_height = self.grid_size * self.cell_size
-        board_left = (SCREEN_WIDTH - board_width) // 2
-        board_top = 50
+        screen.blit(self._background, (0, 0))
 
         # Draw game statistics (time, score, moves)
         stats_y = board_top + board_height + 10
 
         # Time
-        time_text = self.font.render(
+        time_text = self._stat_text(
+            "time",
             f"Time: {int(self.time_remaining // 60):02d}:{int(self.time_remaining % 60):02d}",
-            True,
             WHITE if self.time_remaining > 30 else RED,
         )
         screen.blit(time_text, (board_left, stats_y))
 
         # Score
-        score_text = self.font.render(f"Score: {self.player_score}", True, WHITE)
+        score_text = self._stat_text("score", f"Score: {self.player_score}", WHITE)
         screen.blit(
             score_text, (board_left + board_width - score_text.get_width(), stats_y)
         )
@@ -825,8 +918,8 @@ class IntegrationLevel(BaseLevel):
         win_color = (
             GREEN if self.win_rate > 60 else YELLOW if self.win_rate > 30 else RED
         )
-        win_rate_text = self.font.render(
-            f"Win Rate: {self.win_rate:.1f}%", True, win_color
+        win_rate_text = self._stat_text(
+            "win_rate", f"Win Rate: {self.win_rate:.1f}%", win_color
         )
         screen.blit(win_rate_text, (board_left, stats_y + 30))
 
@@ -847,51 +940,26 @@ class IntegrationLevel(BaseLevel):
         pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
 
         # Moves
-        moves_text = self.font.render(f"Moves: {self.moves_remaining}", True, WHITE)
+        moves_text = self._stat_text("moves", f"Moves: {self.moves_remaining}", WHITE)
         screen.blit(
             moves_text,
             (board_left + (board_width - moves_text.get_width()) // 2, stats_y),
         )
 
-        # Draw grid
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                # Calculate cell position
-                cell_x = board_left + x * self.cell_size
-                cell_y = board_top + y * self.cell_size
-                cell_rect = pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
-
-                # Draw cell based on type
-                if self.grid[y][x] == 1:  # Wall
-                    pygame.draw.rect(screen, (80, 80, 100), cell_rect)
-                else:  # Empty space
-                    pygame.draw.rect(screen, (40, 40, 50), cell_rect)
-
-                # Draw cell border
-                pygame.draw.rect(screen, (30, 30, 30), cell_rect, 1)
-
         # Draw optimal path if requested
-        if self.show_path and self.current_path:
-            for i in range(len(self.current_path) - 1):
-                start_y, start_x = self.current_path[i]
-                end_y, end_x = self.current_path[i + 1]
-
-                # Calculate pixel positions
-                start_px = board_left + start_x * self.cell_size + self.cell_size // 2
-                start_py = board_top + start_y * self.cell_size + self.cell_size // 2
-                end_px = board_left + end_x * self.cell_size + self.cell_size // 2
-                end_py = board_top + end_y * self.cell_size + self.cell_size // 2
-
-                pygame.draw.line(
-                    screen, (100, 200, 255), (start_px, start_py), (end_px, end_py), 2
-                )
+        if self.show_path and len(self.current_path) > 1:
+            points = [(cx[x], cy[y]) for y, x in self.current_path]
+            pygame.draw.lines(screen, (100, 200, 255), False, points, 2)
+
+        # Screen regions covered by entities this frame
+        entity_rects = []
 
         # Draw collectibles
         for item in self.collectibles:
             if not item["collected"]:
                 y, x = item["pos"]
-                item_x = board_left + x * self.cell_size + self.cell_size // 2
-                item_y = board_top + y * self.cell_size + self.cell_size // 2
+                entity_rects.append(self._cell_rect(y, x))
+                item_x, item_y = cx[x], cy[y]
 
                 # Draw collectible as yellow circle
                 pygame.draw.circle(
@@ -901,44 +969,22 @@ class IntegrationLevel(BaseLevel):
                     screen, (255, 255, 200), (item_x, item_y), self.cell_size // 4, 1
                 )
 
-        # Draw enemies
+        # Draw enemies using the sprite for their type and frozen state
+        frozen = self.freeze_time > 0
+        enemy_blits = []
         for enemy in self.enemies:
             y, x = enemy["pos"]
-            enemy_x = board_left + x * self.cell_size + self.cell_size // 2
-            enemy_y = board_top + y * self.cell_size + self.cell_size // 2
-
-            # Different colors for different enemy types
-            if enemy["type"] == "hunter":
-                color = RED
-            elif enemy["type"] == "patrol":
-                color = (200, 100, 50)
-            else:  # Random
-                color = (150, 50, 150)
-
-            # Draw enemy
-            if self.freeze_time > 0:
-                # Draw frozen enemies with blue tint
-                pygame.draw.circle(
-                    screen,
-                    (color[0] // 2, color[1] // 2, 255),
-                    (enemy_x, enemy_y),
-                    self.cell_size // 3,
-                )
-                pygame.draw.circle(
-                    screen, BLUE, (enemy_x, enemy_y), self.cell_size // 3, 2
-                )
-            else:
-                pygame.draw.circle(
-                    screen, color, (enemy_x, enemy_y), self.cell_size // 3
-                )
-                pygame.draw.circle(
-                    screen, (255, 200, 200), (enemy_x, enemy_y), self.cell_size // 3, 1
-                )
+            enemy_rect = self._cell_rect(y, x)
+            entity_rects.append(enemy_rect)
+            enemy_blits.append(
+                (self._enemy_sprites[(enemy["type"], frozen)], enemy_rect)
+            )
+        screen.blits(enemy_blits, doreturn=False)
 
         # Draw player
         player_y, player_x = self.player_pos
-        player_x = board_left + player_x * self.cell_size + self.cell_size // 2
-        player_y = board_top + player_y * self.cell_size + self.cell_size // 2
+        entity_rects.append(self._cell_rect(player_y, player_x))
+        player_x, player_y = cx[player_x], cy[player_y]
         pygame.draw.circle(screen, GREEN, (player_x, player_y), self.cell_size // 3)
         pygame.draw.circle(
             screen, (200, 255, 200), (player_x, player_y), self.cell_size // 3, 2
@@ -946,8 +992,8 @@ class IntegrationLevel(BaseLevel):
 
         # Draw target
         target_y, target_x = self.target_pos
-        target_x = board_left + target_x * self.cell_size + self.cell_size // 2
-        target_y = board_top + target_y * self.cell_size + self.cell_size // 2
+        entity_rects.append(self._cell_rect(target_y, target_x))
+        target_x, target_y = cx[target_x], cy[target_y]
 
         # Draw target as red square
         target_rect = pygame.Rect(
@@ -959,52 +1005,16 @@ class IntegrationLevel(BaseLevel):
         pygame.draw.rect(screen, (200, 50, 50), target_rect)
         pygame.draw.rect(screen, (255, 200, 200), target_rect, 2)
 
-        # Draw collection mode indicator
+        # Mode, power-up and controls panel only changes on discrete events
         collection_y = stats_y + 30
-        mode_text = self.font.render(
-            f"Mode: {'Collecting' if self.collecting_mode else 'Target'}",
-            True,
-            YELLOW if self.collecting_mode else WHITE,
-        )
-        screen.blit(mode_text, (board_left, collection_y))
-
-        # Draw power-ups
-        power_ups_y = collection_y
-        power_text = self.font.render("Power-ups:", True, WHITE)
-        screen.blit(
-            power_text, (board_left + board_width - power_text.get_width(), power_ups_y)
-        )
-
-        # Draw each power-up
-        power_up_x = board_left + board_width - 200
-        for i, (name, count) in enumerate(self.power_ups.items()):
-            text = self.font.render(
-                f"{i+1}. {name.capitalize()}: {count}",
-                True,
-                LIGHT_BLUE if count > 0 else GRAY,
-            )
-            screen.blit(text, (power_up_x, power_ups_y + 25 + i * 25))
-
-        # Draw controls help
-        controls_y = collection_y + 100
-        controls = [
-            "Controls:",
-            "Arrow keys: Move",
-            "Space: Toggle path",
-            "C: Toggle collection mode",
-            "1-3: Use power-ups",
-        ]
-
-        for i, text in enumerate(controls):
-            ctrl_text = self.font.render(text, True, WHITE)
-            screen.blit(ctrl_text, (board_left, controls_y + i * 25))
+        if self._hud_dirty:
+            self._rebuild_hud()
+        screen.blit(self._hud_surf, (board_left, collection_y))
 
         # Draw game over message
         if self.game_over:
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
+            screen.blit(self._overlays["game_over"], (0, 0))
 
             if self.player_pos == self.target_pos:
                 result = "VICTORY!"
@@ -1049,12 +1059,174 @@ class IntegrationLevel(BaseLevel):
         if self.show_instructions:
             self._draw_instructions(screen)
 
+        # Work out which parts of the screen changed since the last frame
+        drawn_path = self.current_path if self.show_path else []
+        overlay_shown = self.game_over or self.show_instructions
+        if overlay_shown or self._prev_entity_rects is None:
+            # Overlays cover the whole screen, so present the full frame
+            self._dirty_rects = None
+        else:
+            hud_rect = pygame.Rect(0, stats_y, SCREEN_WIDTH, SCREEN_HEIGHT - stats_y)
+            self._dirty_rects = self._prev_entity_rects + entity_rects + [hud_rect]
+            if drawn_path != self._prev_drawn_path:
+                self._dirty_rects.append(
+                    pygame.Rect(board_left, board_top, board_width, board_height)
+                )
+
+        # Force a full frame after an overlay so it gets cleared everywhere
+        self._prev_entity_rects = None if overlay_shown else entity_rects
+        self._prev_drawn_path = drawn_path
+
+        self._frame.blit(screen, (0, 0))
+        self._dirty = False
+
+    def _stat_text(self, name, text, color):
+        """Render a stats line, reusing the last surface while it reads the same"""
+        cached = self._stat_texts.get(name)
+        if cached is None or cached[0] != (text, color):
+            cached = ((text, color), self.font.render(text, True, color))
+            self._stat_texts[name] = cached
+        return cached[1]
+
+    def _ensure_caches(self):
+        """Build cached surfaces in the display format on first render"""
+        if self._enemy_sprites is None:
+            self._enemy_sprites = self._build_enemy_sprites()
+            self._overlays = {}
+            for name, alpha in (("game_over", 180), ("instructions", 200)):
+                overlay = pygame.Surface(
+                    (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
+                ).convert_alpha()
+                overlay.fill((0, 0, 0, alpha))
+                self._overlays[name] = overlay
+            self._frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        if self._background is None:
+            self._background = self._build_background()
+
+    def _build_background(self):
+        """Pre-render the static background, title and maze walls"""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill((20, 30, 40))
+
+        # Draw title
+        title = self.title_font.render("PATHFINDER ADVENTURE", True, WHITE)
+        background.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 10))
+
+        # Fill the board with the floor color once, then draw only the walls,
+        # one rect per horizontal run of wall cells
+        background.fill(
+            (40, 40, 50),
+            (self.board_left, self.board_top, self.board_width, self.board_height),
+        )
+        for y, row in enumerate(self.grid):
+            x = 0
+            for cell, run in groupby(row):
+                run_length = len(list(run))
+                if cell == 1:  # Wall
+                    background.fill(
+                        (80, 80, 100),
+                        (
+                            self._px[x],
+                            self._py[y],
+                            run_length * self.cell_size,
+                            self.cell_size,
+                        ),
+                    )
+                x += run_length
+
+        # Draw cell borders as full-length lines along both edges of each cell
+        last = self.cell_size - 1
+        for px in self._px:
+            for line_x in (px, px + last):
+                background.fill(
+                    (30, 30, 30), (line_x, self.board_top, 1, self.board_height)
+                )
+        for py in self._py:
+            for line_y in (py, py + last):
+                background.fill(
+                    (30, 30, 30), (self.board_left, line_y, self.board_width, 1)
+                )
+
+        return background
+
+    def _rebuild_hud(self):
+        """Redraw the mode indicator, power-up list and controls panel"""
+        hud_height = SCREEN_HEIGHT - (self.board_top + self.board_height + 40)
+        self._hud_surf = pygame.Surface(
+            (self.board_width, hud_height), pygame.SRCALPHA
+        ).convert_alpha()
+
+        # Draw collection mode indicator
+        mode_text = self.font.render(
+            f"Mode: {'Collecting' if self.collecting_mode else 'Target'}",
+            True,
+            YELLOW if self.collecting_mode else WHITE,
+        )
+        self._hud_surf.blit(mode_text, (0, 0))
+
+        # Draw power-ups
+        power_text = self.font.render("Power-ups:", True, WHITE)
+        self._hud_surf.blit(power_text, (self.board_width - power_text.get_width(), 0))
+
+        # Draw each power-up
+        power_up_x = self.board_width - 200
+        for i, (name, count) in enumerate(self.power_ups.items()):
+            text = self.font.render(
+                f"{i+1}. {name.capitalize()}: {count}",
+                True,
+                LIGHT_BLUE if count > 0 else GRAY,
+            )
+            self._hud_surf.blit(text, (power_up_x, 25 + i * 25))
+
+        # Draw controls help
+        for i, ctrl_text in enumerate(self._control_texts):
+            self._hud_surf.blit(ctrl_text, (0, 100 + i * 25))
+
+        self._hud_dirty = False
+
+    def _build_enemy_sprites(self):
+        """Pre-render a cell-sized sprite for every enemy type and frozen state"""
+        colors = {
+            "hunter": RED,
+            "patrol": (200, 100, 50),
+            "random": (150, 50, 150),
+        }
+        center = (self.cell_size // 2, self.cell_size // 2)
+        radius = self.cell_size // 3
+
+        sprites = {}
+        for enemy_type, color in colors.items():
+            sprite = pygame.Surface(
+                (self.cell_size, self.cell_size), pygame.SRCALPHA
+            ).convert_alpha()
+            pygame.draw.circle(sprite, color, center, radius)
+            pygame.draw.circle(sprite, (255, 200, 200), center, radius, 1)
+            sprites[(enemy_type, False)] = sprite
+
+            # Frozen enemies are drawn with a blue tint
+            sprite = pygame.Surface(
+                (self.cell_size, self.cell_size), pygame.SRCALPHA
+            ).convert_alpha()
+            pygame.draw.circle(
+                sprite, (color[0] // 2, color[1] // 2, 255), center, radius
+            )
+            pygame.draw.circle(sprite, BLUE, center, radius, 2)
+            sprites[(enemy_type, True)] = sprite
+
+        return sprites
+
+    def _cell_rect(self, y, x):
+        """Get the screen rectangle of a grid cell"""
+        return pygame.Rect(self._px[x], self._py[y], self.cell_size, self.cell_size)
+
+    def get_dirty_rects(self):
+        """Return the screen regions changed by the last render, or None for all"""
+        return self._dirty_rects
+
     def _draw_instructions(self, screen):
         """Draw instructions modal"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlays["instructions"], (0, 0))
 
         # Instructions panel
         panel_width = 600
@@ -1137,15 +1309,13 @@ class IntegrationLevel(BaseLevel):
         current_path = self._find_path_astar(self.player_pos, self.target_pos)
         distance_to_target = len(current_path) if current_path else self.grid_size * 2
 
-        path_factor = 20.0 * (
-            1 - (distance_to_target / (self.optimal_path_length * 1.5))
-        )
+        path_factor = 20.0 * (1 - distance_to_target * self._inv_opt_len)
 
         # Factor 2: Remaining moves
-        move_factor = 10.0 * (self.moves_remaining / 100.0)
+        move_factor = 0.1 * self.moves_remaining
 
         # Factor 3: Remaining time
-        time_factor = 10.0 * (self.time_remaining / self.time_limit)
+        time_factor = 10.0 * self.time_remaining * self._inv_time_limit
 
         # Factor 4: Enemy proximity
         enemy_danger = 0
@@ -1157,17 +1327,14 @@ class IntegrationLevel(BaseLevel):
                     enemy_danger += (5 - distance) * 2
                 else:
                     enemy_danger += 5 - distance
-        enemy_factor = -10.0 * (enemy_danger / 20.0)
+        enemy_factor = -0.5 * enemy_danger
         enemy_factor = max(enemy_factor, -15.0)  # Cap negative impact
 
         # Factor 5: Collected items
-        collected_count = sum(1 for item in self.collectibles if item["collected"])
-        total_items = len(self.collectibles)
-        collection_factor = 5.0 * (collected_count / max(total_items, 1))
+        collection_factor = 5.0 * self._collected_count * self._inv_total_items
 
-        # Factor 6: Available power-ups
-        power_up_count = sum(self.power_ups.values())
-        power_up_factor = 5.0 * (power_up_count / 6.0)  # Assuming max ~6 power-ups
+        # Factor 6: Available power-ups (assuming max ~6 power-ups)
+        power_up_factor = self._power_up_count * (5.0 / 6.0)
 
         # Calculate total win rate
         self.win_rate = min(
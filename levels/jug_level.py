@@ -6,6 +6,18 @@ from visualization.water_visualizer import WaterVisualizer
 from ui.move_counter import MoveCounter
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, BLUE, GREEN, RED
 
+# Default system fonts by size, opened once and shared by every JugLevel
+_FONTS = {}
+
+
+def _font(size):
+    """Get the default system font at a size, opening it on first use"""
+    font = _FONTS.get(size)
+    if font is None:
+        font = pygame.font.SysFont(None, size)
+        _FONTS[size] = font
+    return font
+
 
 class JugLevel(BaseLevel):
     def __init__(self, game_engine, asset_manager):
@@ -22,7 +34,7 @@ class JugLevel(BaseLevel):
         self.set_difficulty(self.difficulty)
 
         # Initialize jugs with empty state
-        self.jugs = [0] * len(self.capacities)
+        self.jugs = [0] * self._n_jugs
 
         # Visualization
         self.visualizer = WaterVisualizer()
@@ -35,8 +47,14 @@ class JugLevel(BaseLevel):
         self.pour_source = None
         self.pour_target = None
         self.pour_amount = 0
-        self.pour_progress = 0
-        self.pour_speed = 2.0  # Speed of pouring animation
+        self._pour_ms = 0  # Time into the pour animation
+        self._pour_duration_ms = 500  # Length of the pouring animation
+
+        # Help text
+        self.font = _font(24)
+        self.title_font = _font(36)
+        self.message_font = _font(64)
+        self.sub_font = _font(32)
 
         # Button areas for jugs
         self.jug_buttons = []
@@ -46,15 +64,32 @@ class JugLevel(BaseLevel):
         self.action_buttons = []
         self.update_action_buttons()
 
-        # Hint button
+        # Hint button, prebuilt for its inactive and active colors
         self.hint_button = pygame.Rect(SCREEN_WIDTH - 120, SCREEN_HEIGHT - 50, 100, 40)
+        self._hint_btn_surfs = [
+            self._build_button_surface(self.hint_button, color, "Hint")
+            for color in ((200, 0, 200), (0, 200, 0))
+        ]
         self.hint_active = False
         self.hint_steps = []
+        self._hint_surfaces = []  # Rendered step text, one per hint step
         self.hint_index = 0
 
-        # Help text
-        self.font = pygame.font.SysFont(None, 24)
-        self.title_font = pygame.font.SysFont(None, 36)
+        # Hint navigation and retry buttons, clicked through handle_event
+        self._prev_btn = pygame.Rect(20, 180, 60, 30)
+        self._next_btn = pygame.Rect(90, 180, 60, 30)
+        self._retry_btn = pygame.Rect(
+            SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 60, 200, 40
+        )
+
+        # Dimming layer shown behind the win/lose message
+        self._completion_overlay = pygame.Surface(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
+        )
+        self._completion_overlay.fill((0, 0, 0, 180))
+
+        # Rendered labels, which rarely change between frames
+        self._text_cache = {}
 
         # Solver for hints
         self.solver = JugSolver()
@@ -63,6 +98,16 @@ class JugLevel(BaseLevel):
         self.win = False
         self.lose = False
 
+        # Last frame drawn while no water was moving, and the state it shows
+        self._static_frame = None
+        self._static_key = None
+        self._dirty_rects = None
+
+    @property
+    def pour_progress(self):
+        """Fraction of the current pour animation that has played, from 0 to 1"""
+        return self._pour_ms / self._pour_duration_ms
+
     def set_difficulty(self, level):
         """Configure puzzle based on difficulty level"""
         self.difficulty = level
@@ -89,8 +134,10 @@ class JugLevel(BaseLevel):
             self.target_amount = 10
             self.max_moves = 15
 
+        self._n_jugs = len(self.capacities)
+
         # Reset state when changing difficulty
-        self.jugs = [0] * len(self.capacities)
+        self.jugs = [0] * self._n_jugs
         self.win = False
         self.lose = False
         self.move_counter.reset(self.max_moves)
@@ -98,24 +145,42 @@ class JugLevel(BaseLevel):
         self.is_pouring = False
         self.hint_active = False
         self.hint_steps = []
+        self._hint_surfaces = []
+        self._static_key = None
+
+        # The number of jugs may have changed, so lay them out again
+        self.update_jug_buttons()
 
     def update_jug_buttons(self):
-        """Update clickable areas for jugs"""
+        """Update clickable areas and drawing positions for jugs"""
         self.jug_buttons = []
+        self._jug_positions = []
+        self._jug_rects = []
 
         jug_width = 80
-        total_width = len(self.capacities) * (jug_width + 20)
+        jug_height = 160
+        total_width = self._n_jugs * (jug_width + 20)
         start_x = (SCREEN_WIDTH - total_width) // 2 + jug_width // 2
+        jug_y = SCREEN_HEIGHT // 2 - 20
 
-        for i in range(len(self.capacities)):
+        for i in range(self._n_jugs):
+            jug_x = start_x + i * (jug_width + 20)
             button_rect = pygame.Rect(
-                start_x + i * (jug_width + 20) - jug_width // 2,
+                jug_x - jug_width // 2,
                 SCREEN_HEIGHT // 2 - 100,
                 jug_width,
                 180,
             )
             self.jug_buttons.append(button_rect)
 
+            # Where the jug itself is drawn, below its capacity label
+            self._jug_positions.append((jug_x, jug_y))
+            self._jug_rects.append(
+                pygame.Rect(
+                    jug_x - jug_width // 2, jug_y - jug_height, jug_width, jug_height
+                )
+            )
+
     def update_action_buttons(self):
         """Update clickable areas for actions"""
         self.action_buttons = []
@@ -146,29 +211,68 @@ class JugLevel(BaseLevel):
         )
         self.action_buttons.append(("Pour", pour_rect))
 
+        # Parallel lists so a click can be hit-tested in one collidelist call
+        self._action_names = [action for action, _ in self.action_buttons]
+        self._action_rects = [rect for _, rect in self.action_buttons]
+
+        # Buttons only change color when a jug is (de)selected, so prebuild both
+        self._action_btn_surfs = {
+            enabled: [
+                self._build_button_surface(rect, color, action)
+                for action, rect in self.action_buttons
+            ]
+            for enabled, color in ((True, (100, 100, 255)), (False, (80, 80, 80)))
+        }
+
+    def _build_button_surface(self, rect, color, label):
+        """Composite a button's fill, border and label into one surface"""
+        surface = pygame.Surface(rect.size)
+        surface.fill(color)
+        pygame.draw.rect(surface, WHITE, surface.get_rect(), 1)
+        text = self.font.render(label, True, WHITE)
+        surface.blit(text, text.get_rect(center=surface.get_rect().center))
+        return surface
+
     def handle_event(self, event):
         """Handle pygame events"""
-        if self.is_pouring or self.win or self.lose:
+        # Out of moves, the only button left is Try Again
+        if self.lose and not self.win:
+            if (
+                event.type == pygame.MOUSEBUTTONDOWN
+                and event.button == 1
+                and self._retry_btn.collidepoint(event.pos)
+            ):
+                self.reset()
+            return
+
+        if self.is_pouring or self.win:
             return
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            click_rect = pygame.Rect(event.pos, (1, 1))
+
             # Check if a jug was clicked
-            for i, rect in enumerate(self.jug_buttons):
-                if rect.collidepoint(event.pos):
-                    self.selected_jug = i if self.selected_jug != i else None
-                    break
+            i = click_rect.collidelist(self.jug_buttons)
+            if i != -1:
+                self.selected_jug = i if self.selected_jug != i else None
 
             # Check if an action button was clicked
             if self.selected_jug is not None:
-                for action, rect in self.action_buttons:
-                    if rect.collidepoint(event.pos):
-                        self.perform_action(action)
-                        break
+                i = click_rect.collidelist(self._action_rects)
+                if i != -1:
+                    self.perform_action(self._action_names[i])
 
             # Check if hint button was clicked
             if self.hint_button.collidepoint(event.pos):
                 self.toggle_hint()
 
+            # Step through the hints
+            elif self.hint_active and self.hint_steps:
+                if self._prev_btn.collidepoint(event.pos):
+                    self.hint_index = max(0, self.hint_index - 1)
+                elif self._next_btn.collidepoint(event.pos):
+                    self.hint_index = min(len(self.hint_steps) - 1, self.hint_index + 1)
+
     def perform_action(self, action):
         """Perform selected action on selected jug"""
         if action == "Fill":
@@ -180,7 +284,7 @@ class JugLevel(BaseLevel):
                 self.pour_amount = (
                     self.capacities[self.selected_jug] - self.jugs[self.selected_jug]
                 )
-                self.pour_progress = 0
+                self._pour_ms = 0
 
         elif action == "Empty":
             if self.jugs[self.selected_jug] > 0:
@@ -189,7 +293,7 @@ class JugLevel(BaseLevel):
                 self.pour_source = self.selected_jug
                 self.pour_target = None  # Empty to "drain"
                 self.pour_amount = self.jugs[self.selected_jug]
-                self.pour_progress = 0
+                self._pour_ms = 0
 
         elif action == "Pour":
             # Need to select another jug to pour into
@@ -200,7 +304,7 @@ class JugLevel(BaseLevel):
         # Future implementation: will add UI to select which jug to pour into
         # For now, we'll use simple approach: select next jug that has space
         source = self.selected_jug
-        for i in range(len(self.jugs)):
+        for i in range(self._n_jugs):
             if i != source and self.jugs[i] < self.capacities[i]:
                 self.start_pour(source, i)
                 break
@@ -218,7 +322,7 @@ class JugLevel(BaseLevel):
                 self.pour_source = source
                 self.pour_target = target
                 self.pour_amount = amount
-                self.pour_progress = 0
+                self._pour_ms = 0
 
     def complete_action(self):
         """Complete the current pouring action"""
@@ -249,8 +353,12 @@ class JugLevel(BaseLevel):
             self.hint_active = True
             # Generate solution steps
             self.hint_steps = self.solver.solve(
-                self.capacities, self.jugs.copy(), self.target_amount
+                self.capacities, tuple(self.jugs), self.target_amount
             )
+            self._hint_surfaces = [
+                self.font.render(f"Step {i + 1}: {step[0]}", True, WHITE)
+                for i, step in enumerate(self.hint_steps)
+            ]
             self.hint_index = 0
         else:
             self.hint_active = False
@@ -258,11 +366,9 @@ class JugLevel(BaseLevel):
     def check_game_state(self):
         """Check if the player has won or lost"""
         # Check for win condition - any jug contains target amount
-        for amount in self.jugs:
-            if amount == self.target_amount:
-                self.win = True
-                self.completed = True
-                break
+        if self.target_amount in self.jugs:
+            self.win = True
+            self.completed = True
 
         # Check for lose condition - out of moves
         if self.move_counter.moves_left <= 0 and not self.win:
@@ -272,9 +378,9 @@ class JugLevel(BaseLevel):
         """Update game logic"""
         # Update pour animation
         if self.is_pouring:
-            self.pour_progress += dt * self.pour_speed
-            if self.pour_progress >= 1.0:
-                self.pour_progress = 1.0
+            self._pour_ms += round(dt * 1000)
+            if self._pour_ms >= self._pour_duration_ms:
+                self._pour_ms = self._pour_duration_ms
                 self.complete_action()
 
         # Update visualizer
@@ -282,21 +388,34 @@ class JugLevel(BaseLevel):
 
     def render(self, screen):
         """Render the water jug puzzle"""
+        # While no water is moving the frame only changes with the level
+        # state, so redraw the last one and present nothing
+        static_key = self._get_static_key()
+        if static_key is not None and static_key == self._static_key:
+            screen.blit(self._static_frame, (0, 0))
+            self._dirty_rects = []
+            return
+        self._dirty_rects = None
+
         # Fill background
         screen.fill((20, 20, 50))  # Dark blue background
 
         # Draw title and goal
-        title = self.title_font.render(
-            f"Water Jug Puzzle - Level {self.difficulty}", True, WHITE
+        title, title_rect = self._render_text(
+            self.title_font,
+            f"Water Jug Puzzle - Level {self.difficulty}",
+            WHITE,
+            midtop=(SCREEN_WIDTH // 2, 30),
         )
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
+        screen.blit(title, title_rect)
 
-        goal = self.font.render(
+        goal, goal_rect = self._render_text(
+            self.font,
             f"Goal: Measure exactly {self.target_amount} liter(s) in any jug",
-            True,
             WHITE,
+            midtop=(SCREEN_WIDTH // 2, 70),
         )
-        screen.blit(goal, (SCREEN_WIDTH // 2 - goal.get_width() // 2, 70))
+        screen.blit(goal, goal_rect)
 
         # Draw move counter
         self.move_counter.render(screen, (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60))
@@ -320,25 +439,50 @@ class JugLevel(BaseLevel):
         elif self.lose:
             self._draw_completion_message(screen, False)
 
+        self._static_key = static_key
+        if static_key is not None:
+            self._static_frame = screen.copy()
+
+    def _get_static_key(self):
+        """Get the state a still frame depends on, or None while water animates"""
+        # Once the puzzle is won or lost nothing changes until a reset. Before
+        # that, waves and bubbles animate whenever any jug holds water
+        finished = self.win or self.lose
+        if not finished and (
+            self.is_pouring or any(self.jugs) or self.visualizer.bubbles
+        ):
+            return None
+        return (
+            self.win,
+            self.lose,
+            tuple(self.jugs),
+            self.selected_jug,
+            self.hint_active,
+            self.hint_index,
+            self.move_counter.moves_left,
+        )
+
     def _draw_jugs(self, screen):
         """Draw the water jugs"""
-        jug_width = 80
         jug_height = 160
-        total_width = len(self.capacities) * (jug_width + 20)
-        start_x = (SCREEN_WIDTH - total_width) // 2 + jug_width // 2
-
-        for i, (capacity, amount) in enumerate(zip(self.capacities, self.jugs)):
-            # Calculate jug position
-            jug_x = start_x + i * (jug_width + 20)
-            jug_y = SCREEN_HEIGHT // 2 - 20
 
-            # Draw jug outline
-            jug_rect = pygame.Rect(
-                jug_x - jug_width // 2, jug_y - jug_height, jug_width, jug_height
-            )
+        # Selection and pour state are the same for every jug this frame
+        font = self.font
+        selected_jug = self.selected_jug
+        draw_jug = self.visualizer.draw_jug
+        if self.is_pouring:
+            pour_progress = self.pour_progress
+            pour_source, pour_target = self.pour_source, self.pour_target
+        else:
+            pour_progress, pour_source, pour_target = 0, None, None
+        show_click_hint = not (self.is_pouring or self.win or self.lose)
 
+        # Jug positions are laid out in update_jug_buttons
+        for i, (jug_rect, (jug_x, jug_y), capacity, amount) in enumerate(
+            zip(self._jug_rects, self._jug_positions, self.capacities, self.jugs)
+        ):
             # Check if jug is selected
-            is_selected = i == self.selected_jug
+            is_selected = i == selected_jug
 
             # Enhanced selection visual - add glow effect around selected jug
             if is_selected:
@@ -359,11 +503,13 @@ class JugLevel(BaseLevel):
                 )
 
                 # Add "Selected" text above jug
-                selected_text = self.font.render("Selected", True, (255, 255, 0))
-                screen.blit(
-                    selected_text,
-                    (jug_x - selected_text.get_width() // 2, jug_y - jug_height - 30),
+                selected_text, selected_rect = self._render_text(
+                    font,
+                    "Selected",
+                    (255, 255, 0),
+                    midtop=(jug_x, jug_y - jug_height - 30),
                 )
+                screen.blit(selected_text, selected_rect)
 
                 border_color = (255, 255, 0)  # Bright yellow for selected
                 border_width = 3
@@ -372,95 +518,74 @@ class JugLevel(BaseLevel):
                 border_width = 1
 
             # Let visualizer draw the jug and water
-            self.visualizer.draw_jug(
+            is_source = i == pour_source
+            is_target = i == pour_target
+            draw_jug(
                 screen,
                 jug_rect,
                 capacity,
                 amount,
-                self.pour_progress if self.is_pouring else 0,
-                (
-                    self.pour_amount
-                    if self.is_pouring
-                    and (i == self.pour_source or i == self.pour_target)
-                    else 0
-                ),
-                i == self.pour_source if self.is_pouring else False,
-                i == self.pour_target if self.is_pouring else False,
+                pour_progress,
+                self.pour_amount if is_source or is_target else 0,
+                is_source,
+                is_target,
                 border_color,
                 border_width,
             )
 
             # Draw jug capacity and current amount
-            capacity_text = self.font.render(f"{capacity}L", True, WHITE)
-            screen.blit(
-                capacity_text,
-                (jug_x - capacity_text.get_width() // 2, jug_y - jug_height - 25),
+            capacity_text, capacity_rect = self._render_text(
+                font,
+                f"{capacity}L",
+                WHITE,
+                midtop=(jug_x, jug_y - jug_height - 25),
             )
+            screen.blit(capacity_text, capacity_rect)
 
-            amount_text = self.font.render(f"{amount}L", True, WHITE)
-            screen.blit(amount_text, (jug_x - amount_text.get_width() // 2, jug_y + 10))
+            amount_text, amount_rect = self._render_text(
+                font, f"{amount}L", WHITE, midtop=(jug_x, jug_y + 10)
+            )
+            screen.blit(amount_text, amount_rect)
 
             # If not selected, add a hint to click
-            if (
-                not is_selected
-                and not self.is_pouring
-                and not self.win
-                and not self.lose
-            ):
-                hint_text = self.font.render("", True, (180, 180, 180))
-                hint_rect = hint_text.get_rect(center=(jug_x, jug_y - jug_height - 45))
+            if show_click_hint and not is_selected:
+                hint_text, hint_rect = self._render_text(
+                    font,
+                    "",
+                    (180, 180, 180),
+                    center=(jug_x, jug_y - jug_height - 45),
+                )
                 screen.blit(hint_text, hint_rect)
 
     def _draw_action_buttons(self, screen):
         """Draw buttons for Fill, Empty, Pour actions"""
-        for action, rect in self.action_buttons:
-            # Button is enabled only if a jug is selected
-            enabled = self.selected_jug is not None
-
-            # Button color based on enabled status
-            color = (100, 100, 255) if enabled else (80, 80, 80)
-
-            # Draw button
-            pygame.draw.rect(screen, color, rect)
-            pygame.draw.rect(screen, WHITE, rect, 1)
-
-            # Draw button text
-            text = self.font.render(action, True, WHITE)
-            text_rect = text.get_rect(center=rect.center)
-            screen.blit(text, text_rect)
+        # Buttons are enabled only if a jug is selected
+        surfaces = self._action_btn_surfs[self.selected_jug is not None]
+        for surface, rect in zip(surfaces, self._action_rects):
+            screen.blit(surface, rect)
 
     def _draw_hint_button(self, screen):
         """Draw the hint button"""
-        # Button color based on hint active status
-        color = (0, 200, 0) if self.hint_active else (200, 0, 200)
-
-        # Draw button
-        pygame.draw.rect(screen, color, self.hint_button)
-        pygame.draw.rect(screen, WHITE, self.hint_button, 1)
-
-        # Draw button text
-        text = self.font.render("Hint", True, WHITE)
-        text_rect = text.get_rect(center=self.hint_button.center)
-        screen.blit(text, text_rect)
+        screen.blit(self._hint_btn_surfs[self.hint_active], self.hint_button)
 
     def _draw_hints(self, screen):
         """Draw hint information"""
         if not self.hint_steps:
-            hint_text = "No solution found!"
-            text = self.font.render(hint_text, True, WHITE)
-            screen.blit(text, (20, 120))
+            text, text_rect = self._render_text(
+                self.font, "No solution found!", WHITE, topleft=(20, 120)
+            )
+            screen.blit(text, text_rect)
             return
 
         # Draw hint header
-        hint_header = self.font.render("Hint Steps:", True, WHITE)
-        screen.blit(hint_header, (20, 120))
+        hint_header, header_rect = self._render_text(
+            self.font, "Hint Steps:", WHITE, topleft=(20, 120)
+        )
+        screen.blit(hint_header, header_rect)
 
         # Show next step
-        if self.hint_index < len(self.hint_steps):
-            step = self.hint_steps[self.hint_index]
-            hint_text = f"Step {self.hint_index + 1}: {step[0]}"
-            text = self.font.render(hint_text, True, WHITE)
-            screen.blit(text, (20, 150))
+        if self.hint_index < len(self._hint_surfaces):
+            screen.blit(self._hint_surfaces[self.hint_index], (20, 150))
 
         # Draw navigation buttons
         prev_enabled = self.hint_index > 0
@@ -469,48 +594,27 @@ class JugLevel(BaseLevel):
         prev_color = (150, 150, 150) if prev_enabled else (80, 80, 80)
         next_color = (150, 150, 150) if next_enabled else (80, 80, 80)
 
-        prev_btn = pygame.Rect(20, 180, 60, 30)
-        next_btn = pygame.Rect(90, 180, 60, 30)
+        prev_btn = self._prev_btn
+        next_btn = self._next_btn
 
         pygame.draw.rect(screen, prev_color, prev_btn)
         pygame.draw.rect(screen, WHITE, prev_btn, 1)
         pygame.draw.rect(screen, next_color, next_btn)
         pygame.draw.rect(screen, WHITE, next_btn, 1)
 
-        prev_text = self.font.render("Prev", True, WHITE)
-        next_text = self.font.render("Next", True, WHITE)
-
-        screen.blit(
-            prev_text,
-            (
-                prev_btn.centerx - prev_text.get_width() // 2,
-                prev_btn.centery - prev_text.get_height() // 2,
-            ),
+        prev_text, prev_rect = self._render_text(
+            self.font, "Prev", WHITE, center=prev_btn.center
         )
-        screen.blit(
-            next_text,
-            (
-                next_btn.centerx - next_text.get_width() // 2,
-                next_btn.centery - next_text.get_height() // 2,
-            ),
+        next_text, next_rect = self._render_text(
+            self.font, "Next", WHITE, center=next_btn.center
         )
-
-        # Handle navigation button clicks
-        mouse_pos = pygame.mouse.get_pos()
-        if pygame.mouse.get_pressed()[0]:
-            if prev_btn.collidepoint(mouse_pos) and prev_enabled:
-                self.hint_index = max(0, self.hint_index - 1)
-                pygame.time.wait(200)  # Prevent multiple clicks
-            elif next_btn.collidepoint(mouse_pos) and next_enabled:
-                self.hint_index = min(len(self.hint_steps) - 1, self.hint_index + 1)
-                pygame.time.wait(200)  # Prevent multiple clicks
+        screen.blit(prev_text, prev_rect)
+        screen.blit(next_text, next_rect)
 
     def _draw_completion_message(self, screen, success):
         """Draw win/lose message overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._completion_overlay, (0, 0))
 
         # Message
         if success:
@@ -521,46 +625,56 @@ class JugLevel(BaseLevel):
             color = RED
 
         # Draw message
-        message_font = pygame.font.SysFont(None, 64)
-        message_text = message_font.render(message, True, color)
-        message_rect = message_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
+        message_text, message_rect = self._render_text(
+            self.message_font,
+            message,
+            color,
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40),
         )
         screen.blit(message_text, message_rect)
 
         # Draw sub-message
-        sub_font = pygame.font.SysFont(None, 32)
-        sub_message = "Press ESC to return to level select"
-        sub_text = sub_font.render(sub_message, True, WHITE)
-        sub_rect = sub_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)
+        sub_text, sub_rect = self._render_text(
+            self.sub_font,
+            "Press ESC to return to level select",
+            WHITE,
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20),
         )
         screen.blit(sub_text, sub_rect)
 
         # If not successful, draw try again button
         if not success:
-            retry_btn = pygame.Rect(
-                SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 60, 200, 40
-            )
+            retry_btn = self._retry_btn
             pygame.draw.rect(screen, (100, 100, 255), retry_btn)
             pygame.draw.rect(screen, WHITE, retry_btn, 2)
 
-            retry_text = sub_font.render("Try Again", True, WHITE)
-            retry_rect = retry_text.get_rect(center=retry_btn.center)
+            retry_text, retry_rect = self._render_text(
+                self.sub_font, "Try Again", WHITE, center=retry_btn.center
+            )
             screen.blit(retry_text, retry_rect)
 
-            # Check for retry button click
-            mouse_pos = pygame.mouse.get_pos()
-            if pygame.mouse.get_pressed()[0] and retry_btn.collidepoint(mouse_pos):
-                self.reset()
+    def get_dirty_rects(self):
+        """Return the screen regions changed by the last render, or None for all"""
+        return self._dirty_rects
+
+    def _render_text(self, font, text, color, **anchor):
+        """Render and place text by a rect anchor, reusing earlier frames' results"""
+        key = (font, text, color, tuple(anchor.items()))
+        label = self._text_cache.get(key)
+        if label is None:
+            surface = font.render(text, True, color)
+            label = (surface, surface.get_rect(**anchor))
+            self._text_cache[key] = label
+        return label
 
     def reset(self):
         """Reset the level to initial state"""
         super().reset()
-        self.jugs = [0] * len(self.capacities)
+        self.jugs = [0] * self._n_jugs
         self.win = False
         self.lose = False
         self.move_counter.reset(self.max_moves)
         self.selected_jug = None
         self.is_pouring = False
         self.hint_active = False
+        self._static_key = None
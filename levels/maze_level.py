@@ -1,12 +1,19 @@
 import pygame
 import random
+import numpy as np
+from itertools import permutations
 from levels.base_level import BaseLevel
 from entities.player import Player
 from entities.obstacles import Teleporter
-from algorithms.search_algorithms import BFS, DFS
+from algorithms.search_algorithms import BFS, DFS, pack_grid
 from visualization.path_visualizer import PathVisualizer
 from settings import BLACK, WHITE, GREEN, RED, BLUE, SCREEN_WIDTH, SCREEN_HEIGHT
 
+# Every order of the four carving directions (up, right, down, left)
+_DIRECTION_ORDERS = list(permutations([(0, -2), (2, 0), (0, 2), (-2, 0)]))
+
+_TELEPORTER_COLORS = [(128, 0, 128), (255, 20, 147)]  # Purple, Pink
+
 
 class MazeLevel(BaseLevel):
     def __init__(self, game_engine, asset_manager):
@@ -21,19 +28,44 @@ class MazeLevel(BaseLevel):
             SCREEN_HEIGHT - (self.grid_height * self.cell_size)
         ) // 2 + 50
 
-        # Initialize grid (1 = wall, 0 = path)
-        self.grid = [
-            [1 for x in range(self.grid_width)] for y in range(self.grid_height)
+        # Pixel center of every cell, indexed [y][x]; the layout never changes
+        half = self.cell_size // 2
+        self._cell_pixels = [
+            [
+                (
+                    self.maze_offset_x + x * self.cell_size + half,
+                    self.maze_offset_y + y * self.cell_size + half,
+                )
+                for x in range(self.grid_width)
+            ]
+            for y in range(self.grid_height)
         ]
 
+        # Initialize grid (1 = wall, 0 = path)
+        self.grid = np.ones((self.grid_height, self.grid_width), dtype=np.uint8)
+
         # Generate maze
         self.generate_maze()
 
         # Set up player
         self.start_pos = (1, 1)
         self.end_pos = (self.grid_width - 2, self.grid_height - 2)
-        self.grid[self.start_pos[1]][self.start_pos[0]] = 0
-        self.grid[self.end_pos[1]][self.end_pos[0]] = 0
+        self.grid[self.start_pos[1], self.start_pos[0]] = 0
+        self.grid[self.end_pos[1], self.end_pos[0]] = 0
+        self.grid_bits = pack_grid(self.grid)
+
+        # Screen rectangle of every cell, and the grid drawn once behind them
+        self._cell_rects = {
+            (x, y): pygame.Rect(
+                self.maze_offset_x + x * self.cell_size,
+                self.maze_offset_y + y * self.cell_size,
+                self.cell_size,
+                self.cell_size,
+            )
+            for y in range(self.grid_height)
+            for x in range(self.grid_width)
+        }
+        self._rebuild_background()
 
         # Create player
         self.player = Player(
@@ -41,9 +73,13 @@ class MazeLevel(BaseLevel):
             (self.cell_size - 6, self.cell_size - 6),
         )
 
+        # Cell the player occupies, or is moving to, so input needs no pixel lookup
+        self.player_cell = self.start_pos
+
         # Create teleporters (random placement)
         self.teleporters = []
         self._add_teleporters(2)  # Add 2 pairs of teleporters
+        self._teleporter_by_cell = {t.cell_pos: t for t in self.teleporters}
 
         # Algorithm selection
         self.algorithms = {"BFS": BFS(), "DFS": DFS()}
@@ -52,24 +88,62 @@ class MazeLevel(BaseLevel):
         # Path visualization
         self.visualizer = PathVisualizer()
         self.current_path = []
-        self.visited_cells = set()
+        self.current_path_set = set()
+        self.visited_cells = bytearray(self.grid_width * self.grid_height)
+        self._overlay = []
         self.show_algorithm = False
 
+        # Search results for the current maze, keyed by algorithm and endpoints
+        self._path_cache = {}
+
+        # Parent links reused by every search, sized for the fixed grid
+        self._search_parents = [0] * (self.grid_width * self.grid_height)
+
         # UI elements
         self.font = pygame.font.SysFont(None, 36)
         self.small_font = pygame.font.SysFont(None, 24)
+        self.message_font = pygame.font.SysFont(None, 64)
+        self.sub_font = pygame.font.SysFont(None, 32)
         self.button_rect = pygame.Rect(50, 20, 150, 40)
         self.button_hovered = False
 
+        # Button label for each algorithm, switched on toggle
+        self._algo_labels = {}
+        for name in self.algorithms:
+            label = self.font.render(f"Algo: {name}", True, WHITE)
+            self._algo_labels[name] = (
+                label,
+                label.get_rect(center=self.button_rect.center),
+            )
+
+        # Text that never changes, rendered once
+        self._instructions = self.small_font.render(
+            "Use arrow keys to move. Press SPACE to toggle algorithm visualization.",
+            True,
+            WHITE,
+        )
+        message = self.message_font.render("Maze Complete!", True, GREEN)
+        self._complete_message = (
+            message,
+            message.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)),
+        )
+        sub_message = self.sub_font.render(
+            "Press ESC to return to level select", True, WHITE
+        )
+        self._complete_sub_message = (
+            sub_message,
+            sub_message.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)),
+        )
+
+        # Dimming layer shown behind the completion message, built on first use
+        self._completion_overlay = None
+
         # Completion state
         self.completed = False
 
     def cell_to_pixel(self, x, y):
         """Convert cell coordinates to pixel coordinates"""
-        return (
-            self.maze_offset_x + x * self.cell_size + self.cell_size // 2,
-            self.maze_offset_y + y * self.cell_size + self.cell_size // 2,
-        )
+        return self._cell_pixels[y][x]
 
     def pixel_to_cell(self, x, y):
         """Convert pixel coordinates to cell coordinates"""
@@ -85,65 +159,86 @@ class MazeLevel(BaseLevel):
         return (cell_x, cell_y)
 
     def generate_maze(self):
-        """Generate a random maze using recursive backtracking algorithm"""
+        """Generate a random maze using the backtracking algorithm"""
         # Start with a grid full of walls
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                self.grid[y][x] = 1
-
-        # Use recursive backtracking to carve paths
-        self._carve_passages_from(1, 1)
-
-    def _carve_passages_from(self, x, y):
-        """Recursive function to carve passages in the maze"""
-        # Mark current cell as path
-        self.grid[y][x] = 0
+        self.grid.fill(1)
 
-        # Shuffle directions to randomize maze generation
-        directions = [(0, -2), (2, 0), (0, 2), (-2, 0)]  # Up, right, down, left
-        random.shuffle(directions)
+        # Carve paths depth-first, keeping each open cell's untried directions
+        # on an explicit stack instead of the call stack
+        grid = self.grid
+        grid[1, 1] = 0
+        stack = [(1, 1, self._shuffled_directions())]
 
-        # Try each direction
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
+        while stack:
+            x, y, directions = stack[-1]
 
-            # Check if the new position is within the grid and is a wall
-            if (
-                0 < new_x < self.grid_width - 1
-                and 0 < new_y < self.grid_height - 1
-                and self.grid[new_y][new_x] == 1
-            ):
+            # Take the next direction that leads to an uncarved cell
+            for dx, dy in directions:
+                new_x, new_y = x + dx, y + dy
 
-                # Carve a path by making the wall between current and new cell into a path
-                self.grid[y + dy // 2][x + dx // 2] = 0
-
-                # Recursively carve passages from the new position
-                self._carve_passages_from(new_x, new_y)
+                # Check if the new position is within the grid and is a wall
+                if (
+                    0 < new_x < self.grid_width - 1
+                    and 0 < new_y < self.grid_height - 1
+                    and grid[new_y, new_x] == 1
+                ):
+                    # Carve the wall between current and new cell, then the new cell
+                    grid[y + dy // 2, x + dx // 2] = 0
+                    grid[new_y, new_x] = 0
+                    stack.append((new_x, new_y, self._shuffled_directions()))
+                    break
+            else:
+                # Every direction tried, so backtrack
+                stack.pop()
+
+    def _shuffled_directions(self):
+        """Return an iterator over the four carving directions in random order"""
+        return iter(random.choice(_DIRECTION_ORDERS))
+
+    def _rebuild_background(self):
+        """Draw the maze grid once onto the surface render blits each frame"""
+        self._background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._background.fill(BLACK)
+
+        # Color every cell by index: 0 path, 1 wall, 2 start, 3 end
+        palette = np.array([WHITE, BLACK, GREEN, RED], dtype=np.uint8)
+        codes = self.grid.T.copy()  # Indexed [x, y] like surfarray
+        codes[self.start_pos] = 2
+        codes[self.end_pos] = 3
+
+        # Scale cells up to pixels, then draw the grid line around each cell
+        cs = self.cell_size
+        pixels = palette[np.repeat(np.repeat(codes, cs, axis=0), cs, axis=1)]
+        edge_x = np.arange(self.grid_width * cs) % cs
+        edge_y = np.arange(self.grid_height * cs) % cs
+        edge_x = (edge_x == 0) | (edge_x == cs - 1)
+        edge_y = (edge_y == 0) | (edge_y == cs - 1)
+        pixels[edge_x[:, None] | edge_y[None, :]] = (50, 50, 50)
+
+        self._background.blit(
+            pygame.surfarray.make_surface(pixels),
+            (self.maze_offset_x, self.maze_offset_y),
+        )
 
     def _add_teleporters(self, num_pairs):
         """Add teleporter pairs to the maze"""
-        for _ in range(num_pairs):
-            # Find two empty cells for a teleporter pair
-            positions = []
-            colors = [(128, 0, 128), (255, 20, 147)]  # Purple, Pink
-
-            while len(positions) < 2:
-                x = random.randint(1, self.grid_width - 2)
-                y = random.randint(1, self.grid_height - 2)
+        # Open cells that are not the player start, end, or another teleporter
+        occupied = {self.start_pos, self.end_pos}
+        occupied.update(t.cell_pos for t in self.teleporters)
+        empty_cells = [
+            (x, y)
+            for y in range(1, self.grid_height - 1)
+            for x in range(1, self.grid_width - 1)
+            if self.grid[y, x] == 0 and (x, y) not in occupied
+        ]
 
-                # Ensure it's not on the player start, end, or another teleporter
-                is_start_or_end = (x, y) == self.start_pos or (x, y) == self.end_pos
-                is_on_teleporter = any(t.cell_pos == (x, y) for t in self.teleporters)
-
-                if (
-                    self.grid[y][x] == 0
-                    and not is_start_or_end
-                    and not is_on_teleporter
-                ):
-                    positions.append((x, y))
+        # Draw every teleporter cell at once, so no two share a cell
+        chosen = random.sample(empty_cells, 2 * num_pairs)
+        for i in range(0, len(chosen), 2):
+            positions = chosen[i : i + 2]
 
             # Create teleporter pair
-            color = random.choice(colors)
+            color = random.choice(_TELEPORTER_COLORS)
             t1 = Teleporter(positions[0], self.cell_to_pixel(*positions[0]), color)
             t2 = Teleporter(positions[1], self.cell_to_pixel(*positions[1]), color)
 
@@ -188,7 +283,7 @@ class MazeLevel(BaseLevel):
             return
 
         # Get current cell position
-        cell_x, cell_y = self.pixel_to_cell(*self.player.position)
+        cell_x, cell_y = self.player_cell
 
         # Calculate new position based on key
         new_cell_x, new_cell_y = cell_x, cell_y
@@ -204,47 +299,77 @@ class MazeLevel(BaseLevel):
         else:
             return  # Not a movement key
 
-        # Ensure cell coordinates are integers
-        new_cell_x, new_cell_y = int(new_cell_x), int(new_cell_y)
-
         # Check if the new position is valid (not a wall)
         if (
             0 <= new_cell_x < self.grid_width
             and 0 <= new_cell_y < self.grid_height
-            and self.grid[new_cell_y][new_cell_x] == 0
+            and self.grid[new_cell_y, new_cell_x] == 0
         ):
 
             # Move player to center of new cell
             new_pos = self.cell_to_pixel(new_cell_x, new_cell_y)
             self.player.move_to(new_pos)
+            self.player_cell = (new_cell_x, new_cell_y)
+
+            # Searches from the old cell will not be asked for again
+            self._path_cache.clear()
 
             # Check for teleporters
-            for teleporter in self.teleporters:
-                if teleporter.cell_pos == (new_cell_x, new_cell_y):
-                    linked_teleporter = teleporter.linked_teleporter
-                    if linked_teleporter:
-                        # Teleport the player
-                        self.player.move_to(linked_teleporter.position)
-                        break
+            teleporter = self._teleporter_by_cell.get(self.player_cell)
+            if teleporter and teleporter.linked_teleporter:
+                # Teleport the player
+                self.player.move_to(teleporter.linked_teleporter.position)
+                self.player_cell = teleporter.linked_teleporter.cell_pos
 
             # Check for completion (reached the end)
-            current_cell = self.pixel_to_cell(*self.player.position)
-            if current_cell == self.end_pos:
+            if self.player_cell == self.end_pos:
                 self.completed = True
 
     def _run_algorithm(self):
         """Run the selected pathfinding algorithm"""
         # Get player's current position
-        start_cell = self.pixel_to_cell(*self.player.position)
-
-        # Run algorithm to find path to end
-        algorithm = self.algorithms[self.current_algorithm]
-        path, visited = algorithm.find_path(self.grid, start_cell, self.end_pos)
+        start_cell = self.player_cell
+
+        # Run algorithm to find path to end, unless this search already ran
+        key = (self.current_algorithm, start_cell, self.end_pos)
+        result = self._path_cache.get(key)
+        if result is None:
+            algorithm = self.algorithms[self.current_algorithm]
+            result = algorithm.find_path(
+                self.grid,
+                start_cell,
+                self.end_pos,
+                self.grid_bits,
+                self._search_parents,
+            )
+            self._path_cache[key] = result
+        path, visited = result
 
         # Update visualization
         self.current_path = path
+        self.current_path_set = set(path)
         self.visited_cells = visited
-        print(f"Path found with {len(visited)} cells visited")
+        self._build_overlay()
+        print(f"Path found with {visited.count(1)} cells visited")
+
+    def _build_overlay(self):
+        """List the highlighted cells once per search instead of per frame"""
+        cell_rects = self._cell_rects
+        path_set = self.current_path_set
+
+        # Visited cells off the path, then the path drawn over them
+        # (the visited bitmap and the cell rects are both in row-major order)
+        self._overlay = [
+            ((200, 200, 255), cell_rect)  # Light blue for visited
+            for (cell_pos, cell_rect), seen in zip(
+                cell_rects.items(), self.visited_cells
+            )
+            if seen and cell_pos not in path_set
+        ]
+        self._overlay.extend(
+            ((100, 100, 255), cell_rects[cell_pos])  # Blue for path
+            for cell_pos in self.current_path
+        )
 
     def update(self, dt):
         """Update maze level logic"""
@@ -253,43 +378,25 @@ class MazeLevel(BaseLevel):
         for teleporter in self.teleporters:
             teleporter.update(dt)
 
-        # Update visualizer
-        self.visualizer.update(dt)
+        # Path animation only advances while the path is on screen
+        if self.show_algorithm and self.current_path:
+            self.visualizer.update(dt)
 
     def render(self, screen):
         """Render the maze level"""
-        # Fill background
-        screen.fill(BLACK)
-
-        # Draw maze grid
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                cell_rect = pygame.Rect(
-                    self.maze_offset_x + x * self.cell_size,
-                    self.maze_offset_y + y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size,
-                )
+        # Background with walls, paths, start and end, which only change with the maze
+        screen.blit(self._background, (0, 0))
 
-                # Determine cell color
-                cell_pos = (x, y)
-                color = BLACK if self.grid[y][x] == 1 else WHITE
-
-                # Mark start and end cells
-                if cell_pos == self.start_pos:
-                    color = GREEN
-                elif cell_pos == self.end_pos:
-                    color = RED
-
-                # Highlight visited cells and path if algorithm visualization is active
-                if self.show_algorithm:
-                    if cell_pos in self.visited_cells and self.grid[y][x] == 0:
-                        color = (200, 200, 255)  # Light blue for visited
-                    if cell_pos in self.current_path:
-                        color = (100, 100, 255)  # Blue for path
-
-                pygame.draw.rect(screen, color, cell_rect)
-                pygame.draw.rect(screen, (50, 50, 50), cell_rect, 1)  # Grid lines
+        # Highlight visited cells and path if algorithm visualization is active,
+        # holding one lock across the per-cell primitives
+        if self.show_algorithm:
+            screen.lock()
+            try:
+                for color, cell_rect in self._overlay:
+                    pygame.draw.rect(screen, color, cell_rect)
+                    pygame.draw.rect(screen, (50, 50, 50), cell_rect, 1)
+            finally:
+                screen.unlock()
 
         # If visualization is active, draw path
         if self.show_algorithm and self.current_path:
@@ -317,39 +424,27 @@ class MazeLevel(BaseLevel):
         pygame.draw.rect(screen, WHITE, self.button_rect, 2)
 
         # Draw button text
-        button_text = self.font.render(f"Algo: {self.current_algorithm}", True, WHITE)
-        button_text_rect = button_text.get_rect(center=self.button_rect.center)
-        screen.blit(button_text, button_text_rect)
+        screen.blit(*self._algo_labels[self.current_algorithm])
 
         # Draw instructions
-        instructions = self.small_font.render(
-            "Use arrow keys to move. Press SPACE to toggle algorithm visualization.",
-            True,
-            WHITE,
-        )
-        screen.blit(instructions, (50, SCREEN_HEIGHT - 30))
+        screen.blit(self._instructions, (50, SCREEN_HEIGHT - 30))
 
     def _render_completion_message(self, screen):
         """Render completion message"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        screen.blit(overlay, (0, 0))
+        # Levels are created before the display mode is set, so the overlay
+        # is converted to the display format the first time it is needed
+        if self._completion_overlay is None:
+            self._completion_overlay = pygame.Surface(
+                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
+            ).convert_alpha()
+            self._completion_overlay.fill((0, 0, 0, 128))
+        screen.blit(self._completion_overlay, (0, 0))
 
         # Draw completion message
-        font = pygame.font.SysFont(None, 64)
-        message = font.render("Maze Complete!", True, GREEN)
-        message_rect = message.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        screen.blit(message, message_rect)
+        screen.blit(*self._complete_message)
 
         # Draw sub-message
-        sub_font = pygame.font.SysFont(None, 32)
-        sub_message = sub_font.render(
-            "Press ESC to return to level select", True, WHITE
-        )
-        sub_rect = sub_message.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)
-        )
-        screen.blit(sub_message, sub_rect)
+        screen.blit(*self._complete_sub_message)
 
     def reset(self):
         """Reset the level to initial state"""
@@ -357,18 +452,25 @@ class MazeLevel(BaseLevel):
 
         # Reset player to start position
         self.player.move_to(self.cell_to_pixel(self.start_pos[0], self.start_pos[1]))
+        self.player_cell = self.start_pos
 
         # Regenerate maze
         self.generate_maze()
 
         # Set start and end to be paths
-        self.grid[self.start_pos[1]][self.start_pos[0]] = 0
-        self.grid[self.end_pos[1]][self.end_pos[0]] = 0
+        self.grid[self.start_pos[1], self.start_pos[0]] = 0
+        self.grid[self.end_pos[1], self.end_pos[0]] = 0
+        self.grid_bits = pack_grid(self.grid)
+        self._rebuild_background()
 
         # Reset teleporters
         self.teleporters = []
         self._add_teleporters(2)
+        self._teleporter_by_cell = {t.cell_pos: t for t in self.teleporters}
 
         # Reset visualization
         self.current_path = []
-        self.visited_cells = set()
+        self.current_path_set = set()
+        self.visited_cells = bytearray(self.grid_width * self.grid_height)
+        self._overlay = []
+        self._path_cache.clear()
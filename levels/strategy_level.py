@@ -1,5 +1,4 @@
 import pygame
-import time
 import random
 from levels.base_level import BaseLevel
 from algorithms.alpha_beta import AlphaBetaAI
@@ -60,6 +59,13 @@ class StrategyLevel(BaseLevel):
         self.font = pygame.font.SysFont(None, 28)
         self.large_font = pygame.font.SysFont(None, 36)
         self.title_font = pygame.font.SysFont(None, 48)
+        self.game_over_font = pygame.font.SysFont(None, 72)
+
+        # Dimming layer shown behind the game over message
+        self._game_over_overlay = pygame.Surface(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
+        )
+        self._game_over_overlay.fill((0, 0, 0, 180))
 
         # UI controls
         self.viz_button_rect = pygame.Rect(SCREEN_WIDTH - 200, 20, 180, 40)
@@ -68,6 +74,24 @@ class StrategyLevel(BaseLevel):
             SCREEN_WIDTH // 2 - 90, SCREEN_HEIGHT - 60, 180, 40
         )
 
+        # Button and legend labels never change, so render them once
+        self._viz_text = self.font.render("Toggle Pruning Visual", True, WHITE)
+        self._viz_text_rect = self._viz_text.get_rect(
+            center=self.viz_button_rect.center
+        )
+        self._reset_text = self.large_font.render("Reset Game", True, WHITE)
+        self._reset_text_rect = self._reset_text.get_rect(
+            center=self.reset_button_rect.center
+        )
+        self._legend_title = self.font.render("Power-ups:", True, WHITE)
+        self._legend_texts = [
+            self.font.render(name, True, WHITE)
+            for name, _ in self.power_ups.get_power_up_types()
+        ]
+
+        # Rendered text for labels that only change with the game state
+        self._text_cache = {}
+
         # Initial setup
         self.initialize_board()
 
@@ -115,6 +139,9 @@ class StrategyLevel(BaseLevel):
             (SCREEN_HEIGHT - self.board_size * self.cell_size) // 2 + 20,
         )
 
+        # The board background, highlights and pieces are redrawn for the new layout
+        self._board_background = None
+
         # Reset power-ups
         if hasattr(self, "power_ups"):
             self.power_ups = PowerUpSystem(
@@ -242,13 +269,17 @@ class StrategyLevel(BaseLevel):
 
         # Start AI thinking
         self.ai_thinking = True
-        self.ai_move_start_time = time.time()
+        self.ai_move_start_time = pygame.time.get_ticks() / 1000
 
-        # Generate visualization data
+        # Generate visualization data once per turn. The AI keeps adding to its
+        # live stats while it searches for its move, so show a snapshot instead
         if self.show_visualization:
-            self.pruning_data = self.ai.get_pruning_stats(
+            stats = self.ai.get_pruning_stats(
                 self.board_state, self.ai_piece, self.player_piece
             )
+            self.pruning_data = dict(
+                stats, pruning_events=list(stats["pruning_events"])
+            )
 
     def apply_power_up(self, power_up_type, row, col):
         """Apply effects from collected power-ups"""
@@ -345,30 +376,20 @@ class StrategyLevel(BaseLevel):
 
     def check_winner(self):
         """Check if there's a winner"""
-        # Count pieces
-        player_pieces = 0
-        ai_pieces = 0
-
         # Check if player reached opponent's side
-        for col in range(self.board_size):
-            if self.board_state[0][col] == self.player_piece:
-                self.winner = self.player_piece
-                self.completed = True
-                return True
+        if self.player_piece in self.board_state[0]:
+            self.winner = self.player_piece
+            self.completed = True
+            return True
 
         # Check if AI reached opponent's side
-        for col in range(self.board_size):
-            if self.board_state[self.board_size - 1][col] == self.ai_piece:
-                self.winner = self.ai_piece
-                return True
+        if self.ai_piece in self.board_state[self.board_size - 1]:
+            self.winner = self.ai_piece
+            return True
 
-        # Count pieces
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                if self.board_state[row][col] == self.player_piece:
-                    player_pieces += 1
-                elif self.board_state[row][col] == self.ai_piece:
-                    ai_pieces += 1
+        # Count pieces, row by row with list.count
+        player_pieces = sum(row.count(self.player_piece) for row in self.board_state)
+        ai_pieces = sum(row.count(self.ai_piece) for row in self.board_state)
 
         # Check if one side has no pieces left
         if player_pieces == 0:
@@ -449,7 +470,10 @@ class StrategyLevel(BaseLevel):
             and not self.game_over
         ):
             # Add a delay to make the AI seem like it's "thinking"
-            if time.time() - self.ai_move_start_time > self.ai_move_delay:
+            if (
+                pygame.time.get_ticks() / 1000 - self.ai_move_start_time
+                > self.ai_move_delay
+            ):
                 self.ai_thinking = False
                 self.ai_make_move()
 
@@ -463,10 +487,13 @@ class StrategyLevel(BaseLevel):
         screen.fill((30, 40, 50))  # Dark blue-gray background
 
         # Draw title
-        title = self.title_font.render(
-            f"Strategy Game - Level {self.difficulty}", True, WHITE
+        title, title_rect = self._render_text(
+            self.title_font,
+            f"Strategy Game - Level {self.difficulty}",
+            WHITE,
+            midtop=(SCREEN_WIDTH // 2, 15),
         )
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 15))
+        screen.blit(title, title_rect)
 
         # Draw board
         self._draw_board(screen)
@@ -492,87 +519,123 @@ class StrategyLevel(BaseLevel):
             self._draw_game_over_message(screen)
 
         # Draw whose turn it is
-        turn_text = self.large_font.render(
+        turn_text, turn_rect = self._render_text(
+            self.large_font,
             "Your Turn" if self.current_turn == self.player_piece else "AI's Turn",
-            True,
             GREEN if self.current_turn == self.player_piece else RED,
+            midtop=(SCREEN_WIDTH // 2, 120),
         )
-        screen.blit(turn_text, (SCREEN_WIDTH // 2 - turn_text.get_width() // 2, 120))
+        screen.blit(turn_text, turn_rect)
 
         # Show AI thinking
         if self.ai_thinking:
-            thinking_text = self.font.render("AI is thinking...", True, WHITE)
-            screen.blit(
-                thinking_text, (SCREEN_WIDTH // 2 - thinking_text.get_width() // 2, 150)
+            thinking_text, thinking_rect = self._render_text(
+                self.font, "AI is thinking...", WHITE, midtop=(SCREEN_WIDTH // 2, 150)
             )
+            screen.blit(thinking_text, thinking_rect)
 
-    def _draw_board(self, screen):
-        """Draw the game board and pieces"""
-        # Draw board background
+    def _build_board_background(self):
+        """Draw the board, its cells and the pieces once for the current layout"""
         board_width = self.board_size * self.cell_size
         board_height = self.board_size * self.cell_size
-        board_rect = pygame.Rect(
-            self.board_offset[0], self.board_offset[1], board_width, board_height
-        )
-        pygame.draw.rect(screen, (80, 80, 80), board_rect)
-        pygame.draw.rect(screen, WHITE, board_rect, 2)
+        background = pygame.Surface((board_width, board_height)).convert()
+        board_rect = background.get_rect()
+        pygame.draw.rect(background, (80, 80, 80), board_rect)
+        pygame.draw.rect(background, WHITE, board_rect, 2)
 
-        # Draw cells and pieces
+        # Draw cells, moving one rect from cell to cell
+        cell_rect = pygame.Rect(0, 0, self.cell_size, self.cell_size)
         for row in range(self.board_size):
             for col in range(self.board_size):
-                # Calculate cell position
-                cell_x = self.board_offset[0] + col * self.cell_size
-                cell_y = self.board_offset[1] + row * self.cell_size
-                cell_rect = pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
+                cell_rect.topleft = (col * self.cell_size, row * self.cell_size)
 
                 # Draw checkerboard pattern
                 if (row + col) % 2 == 0:
-                    pygame.draw.rect(screen, (120, 120, 120), cell_rect)
+                    pygame.draw.rect(background, (120, 120, 120), cell_rect)
                 else:
-                    pygame.draw.rect(screen, (60, 60, 60), cell_rect)
+                    pygame.draw.rect(background, (60, 60, 60), cell_rect)
 
                 # Draw cell border
-                pygame.draw.rect(screen, (40, 40, 40), cell_rect, 1)
-
-                # Highlight selected cell
-                if self.selected_cell and self.selected_cell == (row, col):
-                    highlight = pygame.Surface(
-                        (self.cell_size, self.cell_size), pygame.SRCALPHA
-                    )
-                    highlight.fill((255, 255, 0, 100))
-                    screen.blit(highlight, cell_rect)
-
-                # Highlight valid moves
-                if (row, col) in self.valid_moves:
-                    highlight = pygame.Surface(
-                        (self.cell_size, self.cell_size), pygame.SRCALPHA
-                    )
-                    highlight.fill((0, 255, 0, 100))
-                    screen.blit(highlight, cell_rect)
-
-                # Draw pieces
-                piece = self.board_state[row][col]
-                if piece is not None:
-                    center_x = cell_x + self.cell_size // 2
-                    center_y = cell_y + self.cell_size // 2
-                    radius = int(self.cell_size * 0.4)
-
-                    # Draw different colored pieces for player and AI
-                    if piece == self.player_piece:
-                        pygame.draw.circle(screen, GREEN, (center_x, center_y), radius)
-                        pygame.draw.circle(
-                            screen, WHITE, (center_x, center_y), radius, 2
-                        )
-                    elif piece == self.ai_piece:
-                        pygame.draw.circle(screen, RED, (center_x, center_y), radius)
-                        pygame.draw.circle(
-                            screen, WHITE, (center_x, center_y), radius, 2
-                        )
-                    elif piece > 10:  # Shielded piece
-                        pygame.draw.circle(screen, GREEN, (center_x, center_y), radius)
-                        pygame.draw.circle(
-                            screen, (200, 200, 0), (center_x, center_y), radius, 3
-                        )
+                pygame.draw.rect(background, (40, 40, 40), cell_rect, 1)
+
+        self._board_background = background
+
+        # Translucent cell highlights, reused for every highlighted cell
+        self._selected_highlight = pygame.Surface(
+            (self.cell_size, self.cell_size), pygame.SRCALPHA
+        )
+        self._selected_highlight.fill((255, 255, 0, 100))
+        self._move_highlight = pygame.Surface(
+            (self.cell_size, self.cell_size), pygame.SRCALPHA
+        )
+        self._move_highlight.fill((0, 255, 0, 100))
+
+        # Piece sprites, one cell in size
+        self._player_sprite = self._build_piece_sprite(GREEN, WHITE, 2)
+        self._ai_sprite = self._build_piece_sprite(RED, WHITE, 2)
+        self._shield_sprite = self._build_piece_sprite(GREEN, (200, 200, 0), 3)
+
+    def _build_piece_sprite(self, color, outline_color, outline_width):
+        """Draw an outlined piece circle centred on a cell-sized surface"""
+        sprite = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+        center = (self.cell_size // 2, self.cell_size // 2)
+        radius = int(self.cell_size * 0.4)
+        pygame.draw.circle(sprite, color, center, radius)
+        pygame.draw.circle(sprite, outline_color, center, radius, outline_width)
+        return sprite
+
+    def _draw_board(self, screen):
+        """Draw the game board and pieces"""
+        # Draw board background, built on first use since the display mode has
+        # to be set before the surface can be converted
+        if self._board_background is None:
+            self._build_board_background()
+        screen.blit(self._board_background, self.board_offset)
+
+        # Highlight selected cell
+        if self.selected_cell:
+            row, col = self.selected_cell
+            screen.blit(
+                self._selected_highlight,
+                (
+                    self.board_offset[0] + col * self.cell_size,
+                    self.board_offset[1] + row * self.cell_size,
+                ),
+            )
+
+        # Highlight valid moves
+        for row, col in self.valid_moves:
+            screen.blit(
+                self._move_highlight,
+                (
+                    self.board_offset[0] + col * self.cell_size,
+                    self.board_offset[1] + row * self.cell_size,
+                ),
+            )
+
+        # Draw pieces
+        for row, pieces in enumerate(self.board_state):
+            for col, piece in enumerate(pieces):
+                if piece is None:
+                    continue
+
+                # Pick the sprite for player, AI or shielded pieces
+                if piece == self.player_piece:
+                    sprite = self._player_sprite
+                elif piece == self.ai_piece:
+                    sprite = self._ai_sprite
+                elif piece > 10:  # Shielded piece
+                    sprite = self._shield_sprite
+                else:
+                    continue
+
+                screen.blit(
+                    sprite,
+                    (
+                        self.board_offset[0] + col * self.cell_size,
+                        self.board_offset[1] + row * self.cell_size,
+                    ),
+                )
 
     def _draw_ui(self, screen):
         """Draw UI elements"""
@@ -581,25 +644,25 @@ class StrategyLevel(BaseLevel):
         pygame.draw.rect(screen, viz_color, self.viz_button_rect)
         pygame.draw.rect(screen, WHITE, self.viz_button_rect, 2)
 
-        viz_text = self.font.render("Toggle Pruning Visual", True, WHITE)
-        viz_text_rect = viz_text.get_rect(center=self.viz_button_rect.center)
-        screen.blit(viz_text, viz_text_rect)
+        screen.blit(self._viz_text, self._viz_text_rect)
 
         # Difficulty button
         pygame.draw.rect(screen, BLUE, self.difficulty_button_rect)
         pygame.draw.rect(screen, WHITE, self.difficulty_button_rect, 2)
 
-        diff_text = self.font.render(f"Difficulty: {self.difficulty}", True, WHITE)
-        diff_text_rect = diff_text.get_rect(center=self.difficulty_button_rect.center)
+        diff_text, diff_text_rect = self._render_text(
+            self.font,
+            f"Difficulty: {self.difficulty}",
+            WHITE,
+            center=self.difficulty_button_rect.center,
+        )
         screen.blit(diff_text, diff_text_rect)
 
         # Reset button
         pygame.draw.rect(screen, RED, self.reset_button_rect)
         pygame.draw.rect(screen, WHITE, self.reset_button_rect, 2)
 
-        reset_text = self.large_font.render("Reset Game", True, WHITE)
-        reset_text_rect = reset_text.get_rect(center=self.reset_button_rect.center)
-        screen.blit(reset_text, reset_text_rect)
+        screen.blit(self._reset_text, self._reset_text_rect)
 
         # Draw power-up legend
         self._draw_power_up_legend(screen)
@@ -609,8 +672,7 @@ class StrategyLevel(BaseLevel):
         legend_x = SCREEN_WIDTH - 180
         legend_y = 70
 
-        legend_title = self.font.render("Power-ups:", True, WHITE)
-        screen.blit(legend_title, (legend_x, legend_y))
+        screen.blit(self._legend_title, (legend_x, legend_y))
 
         legend_y += 25
         for i, (name, color) in enumerate(self.power_ups.get_power_up_types()):
@@ -619,15 +681,12 @@ class StrategyLevel(BaseLevel):
             pygame.draw.rect(screen, WHITE, (legend_x, legend_y + i * 20, 15, 15), 1)
 
             # Draw name
-            name_text = self.font.render(name, True, WHITE)
-            screen.blit(name_text, (legend_x + 20, legend_y + i * 20))
+            screen.blit(self._legend_texts[i], (legend_x + 20, legend_y + i * 20))
 
     def _draw_game_over_message(self, screen):
         """Draw game over message"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._game_over_overlay, (0, 0))
 
         # Game over message
         if self.winner == self.player_piece:
@@ -638,22 +697,33 @@ class StrategyLevel(BaseLevel):
             color = RED
 
         # Draw main message
-        game_over_font = pygame.font.SysFont(None, 72)
-        message_surface = game_over_font.render(message, True, color)
-        message_rect = message_surface.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
+        message_surface, message_rect = self._render_text(
+            self.game_over_font,
+            message,
+            color,
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50),
         )
         screen.blit(message_surface, message_rect)
 
         # Draw instruction
-        instruction = self.large_font.render(
-            "Press ESC to return to level select or Reset to play again", True, WHITE
-        )
-        instruction_rect = instruction.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30)
+        instruction, instruction_rect = self._render_text(
+            self.large_font,
+            "Press ESC to return to level select or Reset to play again",
+            WHITE,
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30),
         )
         screen.blit(instruction, instruction_rect)
 
+    def _render_text(self, font, text, color, **anchor):
+        """Render and place text by a rect anchor, reusing earlier frames' results"""
+        key = (font, text, color, tuple(anchor.items()))
+        label = self._text_cache.get(key)
+        if label is None:
+            surface = font.render(text, True, color)
+            label = (surface, surface.get_rect(**anchor))
+            self._text_cache[key] = label
+        return label
+
     def reset(self):
         """Reset the level to initial state"""
         super().reset()
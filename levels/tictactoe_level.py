@@ -1,6 +1,6 @@
 import pygame
-import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from levels.base_level import BaseLevel
 from algorithms.minimax import MinimaxAI
 from visualization.decision_tree import DecisionTreeVisualizer
@@ -41,6 +41,10 @@ class TicTacToeLevel(BaseLevel):
         self.ai_move_delay = 0.5  # Seconds of "thinking" time for AI
         self.ai_selected_move = None
 
+        # The AI searches in the background so frames keep coming while it thinks
+        self._ai_executor = ThreadPoolExecutor(max_workers=1)
+        self._ai_future = None
+
         # Visualization
         self.visualizer = DecisionTreeVisualizer()
         self.show_visualization = False
@@ -50,6 +54,13 @@ class TicTacToeLevel(BaseLevel):
         self.font = pygame.font.SysFont(None, 36)
         self.small_font = pygame.font.SysFont(None, 24)
         self.title_font = pygame.font.SysFont(None, 48)
+        self.game_over_font = pygame.font.SysFont(None, 72)
+
+        # Dimming layer shown behind the game over message
+        self._game_over_overlay = pygame.Surface(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
+        )
+        self._game_over_overlay.fill((0, 0, 0, 180))
 
         # UI controls
         self.viz_button_rect = pygame.Rect(SCREEN_WIDTH - 200, 20, 180, 40)
@@ -66,6 +77,28 @@ class TicTacToeLevel(BaseLevel):
             "random": {"color": (150, 100, 200), "name": "Random Effect"},
         }
 
+        # Button and legend labels never change, so render them once
+        self._viz_text = self.small_font.render("Toggle Visualization", True, WHITE)
+        self._reset_text = self.font.render("Reset Game", True, WHITE)
+        self._viz_text_rect = self._viz_text.get_rect(
+            center=self.viz_button_rect.center
+        )
+        self._reset_text_rect = self._reset_text.get_rect(
+            center=self.reset_button_rect.center
+        )
+        self._legend_title = self.small_font.render("Special Tiles:", True, WHITE)
+        self._legend_texts = [
+            self.small_font.render(info["name"], True, WHITE)
+            for info in self.special_tile_types.values()
+        ]
+
+        # Rendered text for labels that only change with the game state
+        self._text_cache = {}
+
+        # Last rendered frame, reused while nothing on screen changes
+        self._frame = None
+        self._dirty_rects = None
+
         # Initialize the board state
         self.reset_game()
 
@@ -120,13 +153,17 @@ class TicTacToeLevel(BaseLevel):
         self.game_over = False
         self.winner = None
         self.ai_thinking = False
+        self._ai_future = None  # Any search still running is for the old board
         self.show_visualization = False
         self.visualization_data = None
         self.completed = False
+        self._dirty = True
 
     def handle_event(self, event):
         """Handle pygame events"""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self._dirty = True
+
             # Get mouse position
             pos = pygame.mouse.get_pos()
 
@@ -190,12 +227,19 @@ class TicTacToeLevel(BaseLevel):
                 # Start AI thinking process if it's AI's turn
                 if self.current_turn == self.ai_symbol:
                     self.ai_thinking = True
-                    self.ai_move_start_time = time.time()
+                    self.ai_move_start_time = pygame.time.get_ticks() / 1000
 
-                    # Generate AI decision tree for visualization before making the move
                     board_state = self.board.get_state()
 
-                    # Get the decision tree data for visualization
+                    # Start searching for the AI move on a snapshot of the board
+                    self._ai_future = self._ai_executor.submit(
+                        self.ai.get_best_move,
+                        [row[:] for row in board_state],
+                        self.ai_symbol,
+                        self.player_symbol,
+                    )
+
+                    # Generate AI decision tree for visualization before making the move
                     self.visualization_data = self.ai.get_decision_tree(
                         board_state, self.ai_symbol, self.player_symbol
                     )
@@ -227,53 +271,12 @@ class TicTacToeLevel(BaseLevel):
 
     def check_winner(self):
         """Check if there's a winner on the board"""
-        # Check rows, columns and diagonals
-        board_state = self.board.get_state()
-
-        # Check rows
-        for i in range(self.board_size):
-            if all(
-                board_state[i][j] == self.player_symbol for j in range(self.board_size)
-            ):
-                self.winner = self.player_symbol
-                return True
-            if all(board_state[i][j] == self.ai_symbol for j in range(self.board_size)):
-                self.winner = self.ai_symbol
+        # Rows, columns and diagonals are checked as bitmasks
+        for symbol in (self.player_symbol, self.ai_symbol):
+            if self.board.has_line(symbol):
+                self.winner = symbol
                 return True
 
-        # Check columns
-        for j in range(self.board_size):
-            if all(
-                board_state[i][j] == self.player_symbol for i in range(self.board_size)
-            ):
-                self.winner = self.player_symbol
-                return True
-            if all(board_state[i][j] == self.ai_symbol for i in range(self.board_size)):
-                self.winner = self.ai_symbol
-                return True
-
-        # Check main diagonal
-        if all(board_state[i][i] == self.player_symbol for i in range(self.board_size)):
-            self.winner = self.player_symbol
-            return True
-        if all(board_state[i][i] == self.ai_symbol for i in range(self.board_size)):
-            self.winner = self.ai_symbol
-            return True
-
-        # Check other diagonal
-        if all(
-            board_state[i][self.board_size - i - 1] == self.player_symbol
-            for i in range(self.board_size)
-        ):
-            self.winner = self.player_symbol
-            return True
-        if all(
-            board_state[i][self.board_size - i - 1] == self.ai_symbol
-            for i in range(self.board_size)
-        ):
-            self.winner = self.ai_symbol
-            return True
-
         return False
 
     def update(self, dt):
@@ -284,21 +287,21 @@ class TicTacToeLevel(BaseLevel):
             and self.ai_thinking
             and not self.game_over
         ):
-            # Add a delay to make the AI seem like it's "thinking"
-            if time.time() - self.ai_move_start_time > self.ai_move_delay:
+            # Add a delay to make the AI seem like it's "thinking", and wait
+            # for the background search to finish
+            if (
+                pygame.time.get_ticks() / 1000 - self.ai_move_start_time
+                > self.ai_move_delay
+                and self._ai_future.done()
+            ):
                 self.ai_thinking = False
-
-                # Get board state
-                board_state = self.board.get_state()
+                best_move = self._ai_future.result()
+                self._ai_future = None
+                self._dirty = True
 
                 # Check if there are any valid moves first
                 empty_cells = self.board.get_empty_cells()
                 if empty_cells:
-                    # Get AI move
-                    best_move = self.ai.get_best_move(
-                        board_state, self.ai_symbol, self.player_symbol
-                    )
-
                     if best_move:
                         row, col = best_move
                         # Make the AI move
@@ -317,14 +320,24 @@ class TicTacToeLevel(BaseLevel):
 
     def render(self, screen):
         """Render the tic-tac-toe game"""
+        # The board only changes on clicks and AI moves, so between them
+        # redraw the last frame and present nothing
+        if not self._dirty and self._frame is not None:
+            screen.blit(self._frame, (0, 0))
+            self._dirty_rects = []
+            return
+
         # Fill background
         screen.fill((30, 30, 60))  # Dark blue-purple background
 
         # Draw title
-        title = self.title_font.render(
-            f"Tic-Tac-Toe - Level {self.difficulty}", True, WHITE
+        title, title_rect = self._render_text(
+            self.title_font,
+            f"Tic-Tac-Toe - Level {self.difficulty}",
+            WHITE,
+            midtop=(SCREEN_WIDTH // 2, 20),
         )
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 20))
+        screen.blit(title, title_rect)
 
         # Draw board
         self.board.render(screen)
@@ -348,71 +361,75 @@ class TicTacToeLevel(BaseLevel):
         if self.game_over:
             self._draw_game_over_message(screen)
 
+        # Keep this frame for the renders where nothing changes
+        if self._frame is None:
+            self._frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._frame.blit(screen, (0, 0))
+        self._dirty = False
+        self._dirty_rects = None
+
     def _draw_ui_buttons(self, screen):
         """Draw UI buttons"""
         # Visualization toggle button
         viz_color = GREEN if self.show_visualization else BLUE
-        pygame.draw.rect(screen, viz_color, self.viz_button_rect)
+        screen.fill(viz_color, self.viz_button_rect)
         pygame.draw.rect(screen, WHITE, self.viz_button_rect, 2)
 
-        viz_text = self.small_font.render("Toggle Visualization", True, WHITE)
-        viz_text_rect = viz_text.get_rect(center=self.viz_button_rect.center)
-        screen.blit(viz_text, viz_text_rect)
+        screen.blit(self._viz_text, self._viz_text_rect)
 
         # Difficulty button
-        pygame.draw.rect(screen, BLUE, self.difficulty_button_rect)
+        screen.fill(BLUE, self.difficulty_button_rect)
         pygame.draw.rect(screen, WHITE, self.difficulty_button_rect, 2)
 
-        diff_text = self.small_font.render(
-            f"Difficulty: {self.difficulty}", True, WHITE
+        diff_text, diff_text_rect = self._render_text(
+            self.small_font,
+            f"Difficulty: {self.difficulty}",
+            WHITE,
+            center=self.difficulty_button_rect.center,
         )
-        diff_text_rect = diff_text.get_rect(center=self.difficulty_button_rect.center)
         screen.blit(diff_text, diff_text_rect)
 
         # Reset button
-        pygame.draw.rect(screen, RED, self.reset_button_rect)
+        screen.fill(RED, self.reset_button_rect)
         pygame.draw.rect(screen, WHITE, self.reset_button_rect, 2)
 
-        reset_text = self.font.render("Reset Game", True, WHITE)
-        reset_text_rect = reset_text.get_rect(center=self.reset_button_rect.center)
-        screen.blit(reset_text, reset_text_rect)
+        screen.blit(self._reset_text, self._reset_text_rect)
 
     def _draw_game_status(self, screen):
         """Draw game status information"""
         # Current turn indicator
-        turn_text = self.font.render(
+        turn_text, turn_rect = self._render_text(
+            self.font,
             f"Current Turn: {'Player (X)' if self.current_turn == self.player_symbol else 'AI (O)'}",
-            True,
             WHITE,
+            topleft=(50, 80),
         )
-        screen.blit(turn_text, (50, 80))
+        screen.blit(turn_text, turn_rect)
 
         # AI thinking indicator
         if self.ai_thinking:
-            thinking_text = self.font.render("AI is thinking...", True, WHITE)
-            screen.blit(thinking_text, (50, 120))
+            thinking_text, thinking_rect = self._render_text(
+                self.font, "AI is thinking...", WHITE, topleft=(50, 120)
+            )
+            screen.blit(thinking_text, thinking_rect)
 
         # Special tile legend
         if self.special_tiles:
-            legend_text = self.small_font.render("Special Tiles:", True, WHITE)
-            screen.blit(legend_text, (SCREEN_WIDTH - 200, 80))
+            screen.blit(self._legend_title, (SCREEN_WIDTH - 200, 80))
 
-            for i, (tile_type, info) in enumerate(self.special_tile_types.items()):
+            for i, info in enumerate(self.special_tile_types.values()):
                 # Draw color square
                 color_rect = pygame.Rect(SCREEN_WIDTH - 200, 110 + i * 30, 20, 20)
-                pygame.draw.rect(screen, info["color"], color_rect)
+                screen.fill(info["color"], color_rect)
                 pygame.draw.rect(screen, WHITE, color_rect, 1)
 
                 # Draw name
-                type_text = self.small_font.render(info["name"], True, WHITE)
-                screen.blit(type_text, (SCREEN_WIDTH - 170, 110 + i * 30))
+                screen.blit(self._legend_texts[i], (SCREEN_WIDTH - 170, 110 + i * 30))
 
     def _draw_game_over_message(self, screen):
         """Draw game over message"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._game_over_overlay, (0, 0))
 
         # Game over message
         if self.winner == self.player_symbol:
@@ -426,22 +443,37 @@ class TicTacToeLevel(BaseLevel):
             color = WHITE
 
         # Draw main message
-        game_over_font = pygame.font.SysFont(None, 72)
-        message_surface = game_over_font.render(message, True, color)
-        message_rect = message_surface.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
+        message_surface, message_rect = self._render_text(
+            self.game_over_font,
+            message,
+            color,
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50),
         )
         screen.blit(message_surface, message_rect)
 
         # Draw instruction
-        instruction = self.font.render(
-            "Press ESC to return to level select or Reset to play again", True, WHITE
-        )
-        instruction_rect = instruction.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30)
+        instruction, instruction_rect = self._render_text(
+            self.font,
+            "Press ESC to return to level select or Reset to play again",
+            WHITE,
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30),
         )
         screen.blit(instruction, instruction_rect)
 
+    def get_dirty_rects(self):
+        """Return the screen regions changed by the last render, or None for all"""
+        return self._dirty_rects
+
+    def _render_text(self, font, text, color, **anchor):
+        """Render and place text by a rect anchor, reusing earlier frames' results"""
+        key = (font, text, color, tuple(anchor.items()))
+        label = self._text_cache.get(key)
+        if label is None:
+            surface = font.render(text, True, color)
+            label = (surface, surface.get_rect(**anchor))
+            self._text_cache[key] = label
+        return label
+
     def reset(self):
         """Reset the level to initial state"""
         super().reset()
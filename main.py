@@ -44,6 +44,7 @@ def main():
     # Game loop
     clock = pygame.time.Clock()
     previous_time = time.time()
+    overlay_was_active = True
 
     while True:
         # Calculate delta time
@@ -101,12 +102,33 @@ def main():
         if hasattr(game, "help_system"):
             game.help_system.render(screen)
 
-        # Update display
-        pygame.display.flip()
+        # Update display - only present the changed regions when the active
+        # level reports them and no overlay was drawn on top this frame or last
+        overlay_active = _overlay_active(game)
+        dirty_rects = game.get_dirty_rects()
+        if dirty_rects is None or overlay_active or overlay_was_active:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+        overlay_was_active = overlay_active
 
         # Cap the framerate
         clock.tick(FPS)
 
 
+def _overlay_active(game):
+    """Check if the help or tutorial systems drew anything over the game"""
+    if hasattr(game, "help_system"):
+        if game.help_system.help_overlay_active or game.help_system.active_tooltips:
+            return True
+
+    if hasattr(game, "tutorial_manager"):
+        for tutorial in game.tutorial_manager.tutorials.values():
+            if tutorial.active:
+                return True
+
+    return False
+
+
 if __name__ == "__main__":
     main()
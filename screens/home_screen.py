@@ -1,6 +1,5 @@
 import pygame
 import math
-import time
 from ui.buttons import ImageButton, TextButton
 from ui.animated_background import AnimatedBackground
 from settings import (
@@ -36,7 +35,7 @@ class HomeScreen:
         self.logo_pos = [SCREEN_WIDTH // 2, 120]
         self.logo_scale = 1.0
         self.logo_scale_direction = 1
-        self.logo_start_time = time.time()
+        self.logo_start_time = pygame.time.get_ticks() / 1000
 
         # Create buttons
         button_width, button_height = 250, 60
@@ -97,7 +96,7 @@ class HomeScreen:
         self.background.update(dt)
 
         # Animate logo scaling
-        t = time.time() - self.logo_start_time
+        t = pygame.time.get_ticks() / 1000 - self.logo_start_time
         self.logo_scale = 1.0 + math.sin(t) * 0.05  # Subtle pulsing effect
 
         # Update buttons
@@ -168,28 +168,20 @@ class LevelSelectScreen:
             
             # Check if any level is clicked
             mouse_x, mouse_y = event.pos
-            for i, level in enumerate(self.levels):
-                level_x = SCREEN_WIDTH // 2 + i * self.level_spacing - self.current_scroll
-                level_y = self.level_y
-                level_rect = pygame.Rect(level_x - 50, level_y - 50, 100, 100)
+            i = self._level_at(event.pos)
+            if i is not None and self.levels[i].unlocked:
+                # Create click effect
+                self.particles.create_sparkle(mouse_x, mouse_y, 30, (255, 255, 200))
                 
-                if level_rect.collidepoint(mouse_x, mouse_y) and level.unlocked:
-                    # Create click effect
-                    self.particles.create_sparkle(mouse_x, mouse_y, 30, (255, 255, 200))
-                    
-                    # Start level
-                    level_types = [MAZE_LEVEL, WATER_JUG_LEVEL, TICTACTOE_LEVEL, STRATEGY_LEVEL, FINAL_LEVEL]
-                    self.game_engine.state_manager.change_state(PLAY_STATE, level_type=level_types[i])
+                # Start level
+                level_types = [MAZE_LEVEL, WATER_JUG_LEVEL, TICTACTOE_LEVEL, STRATEGY_LEVEL, FINAL_LEVEL]
+                self.game_engine.state_manager.change_state(PLAY_STATE, level_type=level_types[i])
         
         elif event.type == pygame.MOUSEMOTION:
             # Check for level hover
-            mouse_x, mouse_y = event.pos
+            hovered = self._level_at(event.pos)
             for i, level in enumerate(self.levels):
-                level_x = SCREEN_WIDTH // 2 + i * self.level_spacing - self.current_scroll
-                level_y = self.level_y
-                level_rect = pygame.Rect(level_x - 50, level_y - 50, 100, 100)
-                
-                if level_rect.collidepoint(mouse_x, mouse_y) and level.unlocked:
+                if i == hovered and level.unlocked:
                     # Update selected level for detailed view
                     self.selected_level = i
                     level.hover = True
@@ -230,6 +222,19 @@ class LevelSelectScreen:
                     level_types = [MAZE_LEVEL, WATER_JUG_LEVEL, TICTACTOE_LEVEL, STRATEGY_LEVEL, FINAL_LEVEL]
                     self.game_engine.state_manager.change_state(PLAY_STATE, level_type=level_types[self.selected_level])
 
+    def _level_at(self, pos):
+        """Get the index of the level icon under a screen position, or None"""
+        mouse_x, mouse_y = pos
+        # Icons sit on a regular horizontal grid, so only the nearest one can be hit
+        offset = mouse_x - SCREEN_WIDTH // 2 + self.current_scroll
+        i = int((offset + self.level_spacing // 2) // self.level_spacing)
+        if 0 <= i < len(self.levels):
+            level_x = SCREEN_WIDTH // 2 + i * self.level_spacing - self.current_scroll
+            level_rect = pygame.Rect(level_x - 50, self.level_y - 50, 100, 100)
+            if level_rect.collidepoint(mouse_x, mouse_y):
+                return i
+        return None
+
     def update(self, dt):
         # Update scroll with smooth lerp
         self.current_scroll += (self.target_scroll - self.current_scroll) * self.scroll_lerp
@@ -24,9 +24,37 @@ class GameBoard:
             center_pos[1] - self.board_size // 2,
         )
 
+        # Cell rectangles and special tile types never change for a board
+        self._cell_rects = [
+            [
+                pygame.Rect(
+                    self.board_pos[0] + col * self.cell_size,
+                    self.board_pos[1] + row * self.cell_size,
+                    self.cell_size,
+                    self.cell_size,
+                )
+                for col in range(size)
+            ]
+            for row in range(size)
+        ]
+        self._special_tile_map = {(r, c): type for r, c, type in self.special_tiles}
+        self._background = None  # Built on first render, once a display exists
+        self._glyphs = None  # Cell-sized X and O sprites, built with the background
+
+        # Shared translucent overlay for blocked cells
+        self._blocked_overlay = pygame.Surface(
+            (self.cell_size, self.cell_size), pygame.SRCALPHA
+        )
+        self._blocked_overlay.fill((100, 100, 100, 150))
+
         # Initialize the board state (None = empty, 'X', 'O', or 'B' for blocked)
         self.board_state = [[None for _ in range(size)] for _ in range(size)]
 
+        # Bitboards of each symbol's cells (bit row * size + col) and the
+        # masks of every winning row, column and diagonal
+        self.symbol_bits = {"X": 0, "O": 0}
+        self.win_masks = self._build_win_masks(size)
+
         # Special tile colors
         self.special_tile_colors = {
             "double": (0, 200, 100),
@@ -60,6 +88,7 @@ class GameBoard:
         """Place a symbol on the board"""
         if self.is_empty(row, col):
             self.board_state[row][col] = symbol
+            self.symbol_bits[symbol] |= 1 << (row * self.size + col)
 
             # Add placement animation
             cell_center = self.get_cell_center_pos(row, col)
@@ -79,6 +108,20 @@ class GameBoard:
             return True
         return False
 
+    def has_line(self, symbol):
+        """Check if a symbol fills a whole row, column or diagonal"""
+        bits = self.symbol_bits[symbol]
+        return any(bits & mask == mask for mask in self.win_masks)
+
+    @staticmethod
+    def _build_win_masks(size):
+        """Get the bitmask of every row, column and diagonal"""
+        lines = [[(row, col) for col in range(size)] for row in range(size)]
+        lines += [[(row, col) for row in range(size)] for col in range(size)]
+        lines.append([(i, i) for i in range(size)])
+        lines.append([(i, size - 1 - i) for i in range(size)])
+        return [sum(1 << (row * size + col) for row, col in line) for line in lines]
+
     def block_cell(self, row, col):
         """Block a cell so it can't be used"""
         if self.is_empty(row, col):
@@ -88,12 +131,12 @@ class GameBoard:
 
     def get_empty_cells(self):
         """Get a list of empty cells as (row, col) tuples"""
-        empty_cells = []
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.is_empty(row, col):
-                    empty_cells.append((row, col))
-        return empty_cells
+        return [
+            (row, col)
+            for row, cells in enumerate(self.board_state)
+            for col, cell in enumerate(cells)
+            if cell is None
+        ]
 
     def get_cell_at_pos(self, pos):
         """Get the board cell at a screen position, or None if not on the board"""
@@ -115,35 +158,56 @@ class GameBoard:
 
         return None
 
+    def _build_background(self):
+        """Draw the cell backgrounds and borders onto a board-sized surface"""
+        background = pygame.Surface((self.board_size, self.board_size)).convert()
+
+        # Standard cell backgrounds in one fill, then the special tiles
+        background.fill((200, 200, 200))
+        for (row, col), special_type in self._special_tile_map.items():
+            bg_color = self.special_tile_colors.get(special_type, WHITE)
+            cell_rect = self._cell_rects[row][col].move(
+                -self.board_pos[0], -self.board_pos[1]
+            )
+            background.fill(bg_color, cell_rect)
+
+        # Cell borders as grid bands: 2px inside every cell edge, so 4px
+        # between neighbouring cells and 2px around the outside
+        for i in range(self.size + 1):
+            edge = i * self.cell_size
+            start, end = max(0, edge - 2), min(self.board_size, edge + 2)
+            background.fill(BLACK, (start, 0, end - start, self.board_size))
+            background.fill(BLACK, (0, start, self.board_size, end - start))
+
+        return background
+
+    def _build_glyphs(self):
+        """Draw the X and O symbols once onto cell-sized sprites"""
+        glyphs = {}
+        center = (self.cell_size // 2, self.cell_size // 2)
+        for symbol, draw in (("X", self._draw_x), ("O", self._draw_o)):
+            glyph = pygame.Surface(
+                (self.cell_size, self.cell_size), pygame.SRCALPHA
+            ).convert_alpha()
+            draw(glyph, center, self.cell_size * 0.4)
+            glyphs[symbol] = glyph
+        return glyphs
+
     def get_cell_rect(self, row, col):
         """Get the rectangle for a cell"""
-        board_x, board_y = self.board_pos
-        cell_x = board_x + col * self.cell_size
-        cell_y = board_y + row * self.cell_size
-
-        return pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
+        return self._cell_rects[row][col]
 
     def get_cell_center_pos(self, row, col):
         """Get the center position of a cell"""
-        rect = self.get_cell_rect(row, col)
-        return rect.center
+        return self._cell_rects[row][col].center
 
     def is_special_tile(self, row, col):
         """Check if a cell is a special tile"""
-        if not self.special_tiles:
-            return False
-
-        for r, c, type in self.special_tiles:
-            if r == row and c == col:
-                return True
-        return False
+        return (row, col) in self._special_tile_map
 
     def get_special_tile_type(self, row, col):
         """Get the type of a special tile, or None if not special"""
-        for r, c, type in self.special_tiles:
-            if r == row and c == col:
-                return type
-        return None
+        return self._special_tile_map.get((row, col))
 
     def update(self, dt):
         """Update board animations"""
@@ -155,34 +219,18 @@ class GameBoard:
 
     def render(self, screen):
         """Render the game board"""
-        # Draw board background
-        board_rect = pygame.Rect(*self.board_pos, self.board_size, self.board_size)
-        pygame.draw.rect(screen, (50, 50, 50), board_rect)
-
-        # Draw cells
-        for row in range(self.size):
-            for col in range(self.size):
-                cell_rect = self.get_cell_rect(row, col)
-
-                # Draw cell background
-                if self.is_special_tile(row, col):
-                    # Special tile background
-                    special_type = self.get_special_tile_type(row, col)
-                    bg_color = self.special_tile_colors.get(special_type, WHITE)
-                    pygame.draw.rect(screen, bg_color, cell_rect)
-                else:
-                    # Standard cell background
-                    pygame.draw.rect(screen, (200, 200, 200), cell_rect)
-
-                # Draw cell border
-                pygame.draw.rect(screen, BLACK, cell_rect, 2)
-
-                # Draw symbol
-                symbol = self.board_state[row][col]
-                if symbol == "X":
-                    self._draw_x(screen, cell_rect.center, cell_rect.width * 0.4)
-                elif symbol == "O":
-                    self._draw_o(screen, cell_rect.center, cell_rect.width * 0.4)
+        # Cell backgrounds and borders never change, so they're drawn once
+        if self._background is None:
+            self._background = self._build_background()
+            self._glyphs = self._build_glyphs()
+        screen.blit(self._background, self.board_pos)
+
+        # Draw symbols
+        glyphs = self._glyphs
+        for rect_row, state_row in zip(self._cell_rects, self.board_state):
+            for cell_rect, symbol in zip(rect_row, state_row):
+                if symbol in glyphs:
+                    screen.blit(glyphs[symbol], cell_rect)
                 elif symbol == "B":  # Blocked cell
                     self._draw_blocked(screen, cell_rect)
 
@@ -221,6 +269,4 @@ class GameBoard:
         pygame.draw.line(screen, BLACK, rect.bottomleft, rect.topright, 3)
 
         # Draw a "blocked" background
-        overlay = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        overlay.fill((100, 100, 100, 150))
-        screen.blit(overlay, rect)
+        screen.blit(self._blocked_overlay, rect)
@@ -55,34 +55,28 @@ class FadeTransition(ScreenTransition):
 
 
 class SlideTransition(ScreenTransition):
+    # Axis (0 = x, 1 = y) and the sign of the offset for each slide direction
+    SLIDE_AXES = {"left": (0, -1), "right": (0, 1), "up": (1, 1), "down": (1, -1)}
+
     def __init__(self, duration=0.5, direction="left"):
         super().__init__(duration)
         self.direction = direction
+        self.axis, self.sign = self.SLIDE_AXES.get(direction, self.SLIDE_AXES["down"])
 
     def render(self, screen):
         if self.from_screen and self.to_screen:
-            width, height = screen.get_size()
-
-            if self.direction == "left":
-                # Slide from right to left
-                x_offset = int(width * (1 - self.progress))
-                screen.blit(self.from_screen, (-x_offset, 0))
-                screen.blit(self.to_screen, (width - x_offset, 0))
-            elif self.direction == "right":
-                # Slide from left to right
-                x_offset = int(width * self.progress)
-                screen.blit(self.from_screen, (x_offset, 0))
-                screen.blit(self.to_screen, (x_offset - width, 0))
-            elif self.direction == "up":
-                # Slide from bottom to top
-                y_offset = int(height * self.progress)
-                screen.blit(self.from_screen, (0, y_offset))
-                screen.blit(self.to_screen, (0, y_offset - height))
-            else:  # down
-                # Slide from top to bottom
-                y_offset = int(height * (1 - self.progress))
-                screen.blit(self.from_screen, (0, -y_offset))
-                screen.blit(self.to_screen, (0, height - y_offset))
+            size = screen.get_size()[self.axis]
+
+            # Negative slides move in from the far edge, positive ones from the near edge
+            progress = self.progress if self.sign > 0 else 1 - self.progress
+            offset = self.sign * int(size * progress)
+
+            from_pos = [0, 0]
+            to_pos = [0, 0]
+            from_pos[self.axis] = offset
+            to_pos[self.axis] = offset - self.sign * size
+            screen.blit(self.from_screen, from_pos)
+            screen.blit(self.to_screen, to_pos)
 
 
 class ScreenManager:
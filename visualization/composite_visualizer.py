@@ -17,7 +17,7 @@ class CompositeVisualizer:
     def render_decision_tree(self, screen, rect, tree_data, algorithm_type):
         """Render minimax or alpha-beta decision tree"""
         # Draw background
-        pygame.draw.rect(screen, (30, 30, 45), rect)
+        screen.fill((30, 30, 45), rect)
         pygame.draw.rect(screen, WHITE, rect, 1)
 
         # Draw title
@@ -114,7 +114,7 @@ class CompositeVisualizer:
     def render_pruning(self, screen, rect, pruning_data):
         """Render alpha-beta pruning visualization"""
         # Draw background
-        pygame.draw.rect(screen, (30, 30, 45), rect)
+        screen.fill((30, 30, 45), rect)
         pygame.draw.rect(screen, WHITE, rect, 1)
 
         # Draw title
@@ -5,11 +5,33 @@ import math
 class DecisionTreeVisualizer:
     def __init__(self):
         self.font = pygame.font.SysFont(None, 14)
+        self.title_font = pygame.font.SysFont(None, 24)
         self.animation_timer = 0
         self.animation_speed = 0.5  # Animation speed in cycles per second
         self.max_width = 0
         self.max_height = 0
 
+        # Tree and area the node positions were last calculated for
+        self._laid_out_tree = None
+        self._layout_rect = None
+
+        # The title and legend never change, so render them once
+        self._title_surf = self.title_font.render(
+            "Minimax Decision Tree", True, (255, 255, 255)
+        )
+        self._explanation_surfs = [
+            self.font.render(line, True, (200, 200, 200))
+            for line in (
+                "Blue nodes: AI (maximizing)",
+                "Red nodes: Player (minimizing)",
+                "Numbers: Scores (higher is better for AI)",
+                "Yellow border: Best move",
+            )
+        ]
+
+        # Rendered score and move labels, shared by every node showing them
+        self._label_cache = {}
+
     def update(self, dt):
         """Update animation"""
         self.animation_timer = (self.animation_timer + dt * self.animation_speed) % 1.0
@@ -24,18 +46,18 @@ class DecisionTreeVisualizer:
             decision_tree: Decision tree data from Minimax AI
         """
         # Draw background
-        pygame.draw.rect(screen, (20, 20, 40), rect)
+        screen.fill((20, 20, 40), rect)
         pygame.draw.rect(screen, (200, 200, 200), rect, 2)
 
         # Draw title
-        title = "Minimax Decision Tree"
-        title_font = pygame.font.SysFont(None, 24)
-        title_surf = title_font.render(title, True, (255, 255, 255))
-        title_rect = title_surf.get_rect(midtop=(rect.centerx, rect.top + 5))
-        screen.blit(title_surf, title_rect)
+        title_rect = self._title_surf.get_rect(midtop=(rect.centerx, rect.top + 5))
+        screen.blit(self._title_surf, title_rect)
 
-        # Calculate layout
-        self._calculate_layout(decision_tree, rect)
+        # Node positions only change when a new tree or area comes in
+        if decision_tree is not self._laid_out_tree or rect != self._layout_rect:
+            self._calculate_layout(decision_tree, rect)
+            self._laid_out_tree = decision_tree
+            self._layout_rect = pygame.Rect(rect)
 
         # Draw tree connections first
         self._draw_connections(screen, decision_tree, rect)
@@ -150,15 +172,13 @@ class DecisionTreeVisualizer:
 
         # Draw score in node
         if tree["score"] is not None:
-            score_text = self.font.render(str(tree["score"]), True, (255, 255, 255))
+            score_text = self._render_label(str(tree["score"]))
             score_rect = score_text.get_rect(center=(tree["x"], tree["y"]))
             screen.blit(score_text, score_rect)
 
         # Draw move label if exists
         if tree["move"] is not None:
-            move_text = self.font.render(
-                f"{tree['move'][0]},{tree['move'][1]}", True, (255, 255, 255)
-            )
+            move_text = self._render_label(f"{tree['move'][0]},{tree['move'][1]}")
             move_rect = move_text.get_rect(
                 center=(tree["x"], tree["y"] - node_radius - 10)
             )
@@ -195,15 +215,15 @@ class DecisionTreeVisualizer:
 
     def _draw_explanation(self, screen, rect):
         """Draw textual explanation of the visualization"""
-        explanation = [
-            "Blue nodes: AI (maximizing)",
-            "Red nodes: Player (minimizing)",
-            "Numbers: Scores (higher is better for AI)",
-            "Yellow border: Best move",
-        ]
-
         y_pos = rect.bottom - 60
-        for line in explanation:
-            text = self.font.render(line, True, (200, 200, 200))
+        for text in self._explanation_surfs:
             screen.blit(text, (rect.left + 10, y_pos))
             y_pos += 15
+
+    def _render_label(self, text):
+        """Render a node label, reusing the surface for repeated text"""
+        surface = self._label_cache.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, (255, 255, 255))
+            self._label_cache[text] = surface
+        return surface
@@ -30,26 +30,34 @@ class PathVisualizer:
         # Convert path to pixel coordinates
         pixel_path = [grid_to_pixel_func(x, y) for x, y in path]
 
-        # Draw path segments
-        for i in range(len(pixel_path) - 1):
-            start = pixel_path[i]
-            end = pixel_path[i + 1]
-
-            # Calculate progress through path for animation
-            path_progress = (i + self.animation_timer) / len(pixel_path)
-
-            # Modify color based on progress
-            r = int(color[0] * (0.7 + 0.3 * math.sin(path_progress * math.pi * 2)))
-            g = int(color[1] * (0.7 + 0.3 * math.sin(path_progress * math.pi * 2 + 2)))
-            b = int(color[2] * (0.7 + 0.3 * math.sin(path_progress * math.pi * 2 + 4)))
-            segment_color = (r, g, b)
-
-            # Draw line segment
-            pygame.draw.line(screen, segment_color, start, end, line_width)
-
-        # Draw nodes at each point
-        for point in pixel_path:
-            pygame.draw.circle(screen, color, point, line_width + 1)
+        screen.lock()
+        try:
+            # Draw path segments
+            for i in range(len(pixel_path) - 1):
+                start = pixel_path[i]
+                end = pixel_path[i + 1]
+
+                # Calculate progress through path for animation
+                path_progress = (i + self.animation_timer) / len(pixel_path)
+
+                # Modify color based on progress
+                r = int(color[0] * (0.7 + 0.3 * math.sin(path_progress * math.pi * 2)))
+                g = int(
+                    color[1] * (0.7 + 0.3 * math.sin(path_progress * math.pi * 2 + 2))
+                )
+                b = int(
+                    color[2] * (0.7 + 0.3 * math.sin(path_progress * math.pi * 2 + 4))
+                )
+                segment_color = (r, g, b)
+
+                # Draw line segment
+                pygame.draw.line(screen, segment_color, start, end, line_width)
+
+            # Draw nodes at each point
+            for point in pixel_path:
+                pygame.draw.circle(screen, color, point, line_width + 1)
+        finally:
+            screen.unlock()
 
     def render_visited(
         self, screen, visited, grid_to_pixel_func, base_color=(200, 200, 255)
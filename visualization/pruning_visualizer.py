@@ -24,7 +24,7 @@ class PruningVisualizer:
             pruning_data: Dictionary with pruning statistics
         """
         # Draw background
-        pygame.draw.rect(screen, (20, 30, 40), rect)
+        screen.fill((20, 30, 40), rect)
         pygame.draw.rect(screen, WHITE, rect, 2)
 
         # Draw title
@@ -236,7 +236,7 @@ class PruningVisualizer:
 
         # Draw explanation panel
         exp_rect = pygame.Rect(rect.left, rect.bottom - 100, rect.width, 90)
-        pygame.draw.rect(screen, (40, 40, 40, 150), exp_rect)
+        screen.fill((40, 40, 40, 150), exp_rect)
         pygame.draw.rect(screen, WHITE, exp_rect, 1)
 
         # Draw text
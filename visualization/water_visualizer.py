@@ -1,6 +1,7 @@
 import pygame
 import math
 import random
+import numpy as np
 
 
 class WaterVisualizer:
@@ -12,10 +13,16 @@ class WaterVisualizer:
         self.highlights = []
         self.bubbles = []
 
+        # Wave points across the water surface share one phase per frame
+        self.wave_points = 12
+        self._wave_indices = np.arange(self.wave_points)
+        self._update_waves()
+
     def update(self, dt):
         """Update water animation"""
         # Update wave animation
         self.wave_offset = (self.wave_offset + dt * self.wave_speed) % (math.pi * 2)
+        self._update_waves()
 
         # Update bubbles
         self._update_bubbles(dt)
@@ -83,13 +90,9 @@ class WaterVisualizer:
             points.append((rect.right, water_level))
 
             # Generate wave points across top of water
-            wave_points = 12
-            for i in range(wave_points):
-                x = rect.right - (i * rect.width / (wave_points - 1))
-                # Add wave effect
-                wave = math.sin(self.wave_offset + i * 0.5) * self.wave_height
-                y = water_level + wave
-                points.append((x, y))
+            steps = self._wave_indices * rect.width / (self.wave_points - 1)
+            wave_ys = (water_level + self._waves).tolist()
+            points.extend(zip((rect.right - steps).tolist(), wave_ys))
 
             # Top left with waves
             points.append((rect.left, water_level))
@@ -98,12 +101,7 @@ class WaterVisualizer:
             pygame.draw.polygon(screen, self.water_color, points)
 
             # Draw water line on top
-            wave_line = []
-            for i in range(wave_points):
-                x = rect.left + (i * rect.width / (wave_points - 1))
-                wave = math.sin(self.wave_offset + i * 0.5) * self.wave_height
-                y = water_level + wave
-                wave_line.append((x, y))
+            wave_line = list(zip((rect.left + steps).tolist(), wave_ys))
 
             pygame.draw.lines(screen, (255, 255, 255, 80), False, wave_line, 2)
 
@@ -138,6 +136,12 @@ class WaterVisualizer:
             elif is_target:
                 self._draw_pouring(screen, rect, water_level, False, pour_progress)
 
+    def _update_waves(self):
+        """Compute the wave height at each surface point for the current offset"""
+        self._waves = (
+            np.sin(self.wave_offset + self._wave_indices * 0.5) * self.wave_height
+        )
+
     def _draw_pouring(self, screen, rect, water_level, is_out, progress):
         """Draw water pouring in or out animation"""
         if is_out: